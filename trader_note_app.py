@@ -28,6 +28,7 @@ v0.10.14 변경 사항:
     - 유통비율 숫자 폭 최적화
 """
 
+import hashlib
 import json
 import os
 import re
@@ -35,22 +36,29 @@ import shutil
 import sys
 import time
 import uuid
-import zipfile
+from array import array
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QRectF, QPointF, QRect, QPoint, QEvent, QSize, QUrl
+try:
+    import orjson  # 선택 의존성: 있으면 JSON 인코딩을 C 구현으로 수행
+except ImportError:
+    orjson = None
+
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QRectF, QPointF, QRect, QEvent, QSize, QUrl, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QDesktopServices
 from PyQt5.QtGui import (
-    QImage, QPixmap, QPainterPath, QPen, QColor, QPainter, QIcon,
+    QImage, QPixmap, QPixmapCache, QPainterPath, QPolygonF, QPen, QColor, QPainter, QIcon,
     QTextCharFormat, QTextListFormat, QTextBlockFormat, QTextCursor, QFont, QBrush, QKeySequence
 )
 from PyQt5.QtWidgets import (
-    QApplication, QFileDialog, QGraphicsPixmapItem, QGraphicsPathItem, QGraphicsScene, QGraphicsView,
+    QApplication, QFileDialog, QGraphicsItem, QGraphicsPixmapItem, QGraphicsPathItem, QGraphicsItemGroup, QGraphicsScene, QGraphicsView,
     QLabel, QLineEdit, QMainWindow, QMessageBox, QShortcut, QSplitter, QTextEdit, QToolButton,
     QVBoxLayout, QHBoxLayout, QWidget, QInputDialog, QComboBox, QCheckBox, QGroupBox, QPushButton,
-    QLayout, QWidgetItem, QFrame, QTreeWidget, QTreeWidgetItem, QMenu, QPlainTextEdit,
+    QFrame, QTreeWidget, QTreeWidgetItem, QMenu, QPlainTextEdit,
     QAbstractItemView, QButtonGroup, QSizePolicy, QStackedWidget, QStyle, QStyledItemDelegate,
     QStyleOptionViewItem, QSplitterHandle, QTabWidget, QScrollArea, QListWidget, QListWidgetItem, QDialog
 )
@@ -62,8 +70,22 @@ BACKUP_DIR = os.path.join("data", "backups")
 MAX_BACKUPS = 10  # 최대 백업 파일 개수
 MAX_IDEAS_BACKUPS = 20  # Global Ideas 최대 백업 파일 개수
 MAX_DATA_SIZE_MB = 50  # 최대 데이터 크기 (MB)
+JOURNAL_MAX_WRITES = 50  # journal(변경 아이템만 저장) 연속 기록 횟수 상한, 넘으면 전체 저장으로 통합
+JOURNAL_MAX_RATIO = 0.25  # journal 크기가 전체 JSON의 이 비율을 넘으면 전체 저장
 ASSETS_DIR = "assets"
+# 클립보드 PNG 저장 품질: Qt PNG는 quality가 높을수록 zlib 압축 레벨이 낮음 (80 → 레벨 1, 인코딩 빠름)
+PASTE_PNG_QUALITY = 80
+# 디코딩된 차트 이미지/축소본을 담는 QPixmapCache 한도 (KB)
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
 ROOT_CATEGORY_ID = "__ROOT__"  # ROOT 폴더 고정 ID (삭제 불가)
+STROKE_SIMPLIFY_EPSILON = 0.75  # 선 저장 시 단순화 허용 오차 (px)
+STROKE_COORD_DECIMALS = 2  # 선 좌표 저장 소수 자릿수 (JSON 크기 절감)
+# 차트 뷰를 OpenGL viewport로 그릴지 여부 (글꼴/드라이버 문제 가능성이 있어 기본은 끔)
+USE_OPENGL_VIEWPORT = os.environ.get("TRADER_NOTE_OPENGL", "") == "1"
+# DB JSON을 들여쓰기해서 저장할지 여부 (직접 열어볼 때만 켬, 기본은 compact로 크기/인코딩 시간 절감)
+PRETTY_JSON_DB = os.environ.get("TRADER_NOTE_PRETTY_JSON", "") == "1"
+# 파일로 연 이미지를 복사 대신 하드링크로 저장할지 여부 (같은 볼륨이면 즉시 완료; 원본을 편집하면 저장본도 바뀌므로 기본은 끔)
+HARDLINK_IMAGES = os.environ.get("TRADER_NOTE_HARDLINK_IMAGES", "") == "1"
 
 DEFAULT_CHECK_QUESTIONS = [
     "Q. 매집구간이 보이는가?",
@@ -110,19 +132,15 @@ def _format_relative_time(timestamp: int) -> str:
         return dt.strftime("%Y-%m-%d")
 
 
-def _ensure_dir(path: str) -> None:
-    os.makedirs(path, exist_ok=True)
+# 이번 실행에서 이미 생성/확인한 디렉토리 (저장마다 makedirs 호출 생략)
+_ENSURED_DIRS: set = set()
 
 
-def _validate_json_serializable(data: Any) -> Tuple[bool, Optional[str]]:
-    """JSON 직렬화 가능 여부 검증"""
-    try:
-        json.dumps(data, ensure_ascii=False, default=str)
-        return True, None
-    except (TypeError, ValueError) as e:
-        return False, str(e)
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+def _ensure_dir(path: str) -> None:
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
 
 
 def _create_backup(db_path: str) -> Optional[str]:
@@ -236,32 +254,39 @@ def _cleanup_old_ideas_backups() -> None:
         pass
 
 
-def _check_data_size(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-    """데이터 크기 확인"""
-    try:
-        json_str = json.dumps(data, ensure_ascii=False, default=str)
-        size_mb = len(json_str.encode('utf-8')) / (1024 * 1024)
-        if size_mb > MAX_DATA_SIZE_MB:
-            return False, f"Data size ({size_mb:.2f} MB) exceeds maximum ({MAX_DATA_SIZE_MB} MB)"
-        return True, None
-    except Exception as e:
-        return False, f"Error checking data size: {str(e)}"
+def _dumps_json_bytes(data: Any, indent: Optional[bool] = None) -> bytes:
+    """
+    JSON을 UTF-8 bytes로 직렬화 (orjson이 있으면 사용, 실패 시 표준 json)
+    indent=None이면 PRETTY_JSON_DB 설정을 따름
+    """
+    if indent is None:
+        indent = PRETTY_JSON_DB
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except Exception:
+            pass
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
+def _content_digest(payload: bytes) -> bytes:
+    """저장 본문 digest (마지막 키인 updated_at/save_id는 제외)"""
+    cut = payload.rfind(b'"updated_at"')
+    body = memoryview(payload)[:cut] if cut > 0 else payload
+    return hashlib.blake2b(body, digest_size=16).digest()
 
-def _safe_write_json(path: str, data: Dict[str, Any], retries: int = 12, base_delay: float = 0.08, create_backup: bool = True) -> Tuple[bool, Optional[str]]:
+
+def _safe_write_bytes(path: str, payload: bytes, retries: int = 12, base_delay: float = 0.08, create_backup: bool = True) -> Tuple[bool, Optional[str]]:
     """
-    안전한 JSON 파일 저장
+    이미 직렬화된 JSON bytes를 안전하게 저장 (백그라운드 스레드에서도 호출 가능)
     Returns: (success: bool, error_message: Optional[str])
     """
-    # 1. JSON 직렬화 가능 여부 검증
-    is_valid, error = _validate_json_serializable(data)
-    if not is_valid:
-        return False, f"Data is not JSON serializable: {error}"
-    
     # 2. 데이터 크기 확인
-    size_ok, size_error = _check_data_size(data)
-    if not size_ok:
-        return False, size_error
+    size_mb = len(payload) / (1024 * 1024)
+    if size_mb > MAX_DATA_SIZE_MB:
+        return False, f"Data size ({size_mb:.2f} MB) exceeds maximum ({MAX_DATA_SIZE_MB} MB)"
     
     # 3. 백업 생성 (기존 파일이 있는 경우)
     backup_path = None
@@ -273,12 +298,18 @@ def _safe_write_json(path: str, data: Dict[str, Any], retries: int = 12, base_de
 
     # 4. 임시 파일에 저장
     try:
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            # replace 전에 디스크에 내려 써서 교체 후 빈/잘린 파일이 남지 않도록 함
+            f.flush()
+            os.fsync(f.fileno())
     except Exception as e:
         return False, f"Failed to write temporary file: {str(e)}"
 
     # 5. 원본 파일로 교체 (재시도)
+    # 다른 프로세스의 파일 잠금으로 replace가 실패하는 것은 Windows 한정 → 그 외 OS는 1회만 시도
+    if os.name != "nt":
+        retries = 1
     for i in range(max(1, retries)):
         try:
             os.replace(tmp_path, path)
@@ -293,8 +324,8 @@ def _safe_write_json(path: str, data: Dict[str, Any], retries: int = 12, base_de
                     try:
                         os.replace(tmp_path, autosave_path)
                     except Exception:
-                        with open(autosave_path, "w", encoding="utf-8") as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
+                        with open(autosave_path, "wb") as f:
+                            f.write(payload)
                         try:
                             os.remove(tmp_path)
                         except Exception:
@@ -315,8 +346,8 @@ def _safe_write_json(path: str, data: Dict[str, Any], retries: int = 12, base_de
                     try:
                         os.replace(tmp_path, autosave_path)
                     except Exception:
-                        with open(autosave_path, "w", encoding="utf-8") as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
+                        with open(autosave_path, "wb") as f:
+                            f.write(payload)
                         try:
                             os.remove(tmp_path)
                         except Exception:
@@ -335,8 +366,8 @@ def _safe_write_json(path: str, data: Dict[str, Any], retries: int = 12, base_de
         try:
             os.replace(tmp_path, autosave_path)
         except Exception:
-            with open(autosave_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(autosave_path, "wb") as f:
+                f.write(payload)
             try:
                 os.remove(tmp_path)
             except Exception:
@@ -354,55 +385,168 @@ def _relpath_norm(path: str) -> str:
     return path.replace("\\", "/")
 
 
+# 상대경로 → 절대경로 메모 (os.path.abspath는 매번 getcwd 호출; 실행 중 작업 디렉터리는 바뀌지 않음)
+_ABSPATH_CACHE: Dict[str, str] = {}
+ABSPATH_CACHE_MAX = 4096
+
+
 def _abspath_from_rel(rel_path: str) -> str:
-    return os.path.abspath(rel_path.replace("/", os.sep))
+    out = _ABSPATH_CACHE.get(rel_path)
+    if out is None:
+        out = os.path.abspath(rel_path.replace("/", os.sep))
+        if len(_ABSPATH_CACHE) >= ABSPATH_CACHE_MAX:
+            _ABSPATH_CACHE.clear()
+        _ABSPATH_CACHE[rel_path] = out
+    return out
+
+
+# str.isalnum() + 공백/_/- 이외 문자 (유니코드 \w는 isalnum()과 '_'와 정확히 일치 → 한글 이름 유지)
+_RE_FOLDER_UNSAFE = re.compile(r'[^\w \-]+')
 
 
 def _sanitize_for_folder(name: str, fallback: str) -> str:
-    safe = "".join(ch for ch in name if ch.isalnum() or ch in (" ", "_", "-")).strip().replace(" ", "_")
+    safe = _RE_FOLDER_UNSAFE.sub('', name).strip().replace(" ", "_")
     return safe or fallback
 
 
+_RE_HTML_TAG_HINT = re.compile(r'<(?:span|br|div)', re.IGNORECASE)
+
+
 def _looks_like_html(s: str) -> bool:
-    t = (s or "").lstrip().lower()
-    if not t:
+    # 본문 전체를 lstrip/lower로 복사하지 않고 앞부분만 보고, 태그 검색은 원본에서 한 번만 스캔
+    if not s or "<" not in s:
+        return False
+    n = len(s)
+    i = 0
+    while i < n and s[i].isspace():
+        i += 1
+    if i == n:
         return False
-    return (
-        t.startswith("<!doctype")
-        or t.startswith("<html")
-        or t.startswith("<p")
-        or "<span" in t
-        or "<br" in t
-        or "<div" in t
-    )
+    head = s[i:i + 9].lower()
+    if head.startswith(("<!doctype", "<html", "<p")):
+        return True
+    return _RE_HTML_TAG_HINT.search(s, i) is not None
+
+
+# 페이지 전환마다 같은 노트 HTML에 정규식 치환을 반복하지 않도록 입력 → 결과 캐시
+_STRIP_HTML_CACHE: Dict[str, str] = {}
+STRIP_HTML_CACHE_MAX = 256
 
 
 def _strip_highlight_html(html: str) -> str:
     if not html:
         return html
+    cached = _STRIP_HTML_CACHE.get(html)
+    if cached is not None:
+        return cached
+    out = _strip_highlight_html_uncached(html)
+    if len(_STRIP_HTML_CACHE) >= STRIP_HTML_CACHE_MAX:
+        _STRIP_HTML_CACHE.clear()
+    _STRIP_HTML_CACHE[html] = out
+    # 저장된 노트는 이미 정리된 결과이므로 다음 페이지 표시 때 바로 적중하도록 결과도 키로 등록 (재적용해도 동일)
+    _STRIP_HTML_CACHE[out] = out
+    return out
+
+
+# background-color / background 의 #hex, rgb(a)() 값을 한 번의 스캔으로 제거
+_RE_BG_ANY = re.compile(r'background(?:-color)?\s*:\s*(?:#[0-9a-fA-F]{3,8}|rgba?\([^)]+\))\s*;?', re.IGNORECASE)
+# 비었거나 세미콜론/공백만 남은 style 속성 제거
+_RE_STYLE_EMPTY = re.compile(r'style="[\s;]*"', re.IGNORECASE)
+_RE_STYLE_ATTR = re.compile(r'style="([^"]*?)"', re.IGNORECASE)
+_RE_STYLE_SEPARATORS = re.compile(r'\s*;+\s*')
+
+
+def _tidy_style(m: re.Match) -> str:
+    inner = (m.group(1) or "").strip()
+    inner = _RE_STYLE_SEPARATORS.sub('; ', inner).strip()
+    inner = inner.strip("; ").strip()
+    return f'style="{inner}"' if inner else ""
+
+
+def _strip_highlight_html_uncached(html: str) -> str:
     if not _looks_like_html(html):
         return html
+    # 정규식이 건드릴 대상이 없으면 그대로 반환 (in 검사는 C 수준 스캔이라 정규식보다 훨씬 쌈)
+    low = html.lower()
+    if "background" not in low and 'style="' not in low:
+        return html
 
     s = html
-    s = re.sub(r'background-color\s*:\s*#[0-9a-fA-F]{3,8}\s*;?', '', s, flags=re.IGNORECASE)
-    s = re.sub(r'background-color\s*:\s*rgba?\([^)]+\)\s*;?', '', s, flags=re.IGNORECASE)
-    s = re.sub(r'background\s*:\s*#[0-9a-fA-F]{3,8}\s*;?', '', s, flags=re.IGNORECASE)
-    s = re.sub(r'background\s*:\s*rgba?\([^)]+\)\s*;?', '', s, flags=re.IGNORECASE)
-    s = re.sub(r'style="\s*;+\s*"', '', s, flags=re.IGNORECASE)
-    s = re.sub(r'style="\s*"', '', s, flags=re.IGNORECASE)
-    s = re.sub(r'\sstyle=""', '', s, flags=re.IGNORECASE)
-
-    def _tidy_style(m: re.Match) -> str:
-        inner = (m.group(1) or "").strip()
-        inner = re.sub(r'\s*;+\s*', '; ', inner).strip()
-        inner = inner.strip("; ").strip()
-        return f'style="{inner}"' if inner else ""
-
-    s = re.sub(r'style="([^"]*?)"', _tidy_style, s, flags=re.IGNORECASE)
+    s = _RE_BG_ANY.sub('', s)
+    s = _RE_STYLE_EMPTY.sub('', s)
+    s = _RE_STYLE_ATTR.sub(_tidy_style, s)
     return s
 
 
+@contextmanager
+def _signals_blocked(*objs: QObject):
+    """여러 위젯의 시그널을 한 번에 막고, 예외가 나도 원래 상태로 복원"""
+    olds = [o.blockSignals(True) for o in objs]
+    try:
+        yield
+    finally:
+        for o, old in zip(objs, olds):
+            o.blockSignals(old)
+
+
+# 서식 툴바용 QTextCharFormat (조합이 몇 개뿐이라 클릭마다 새로 만들지 않고 공유, merge 시 값 복사됨)
+_STYLE_FORMAT_CACHE: Dict[Tuple[Optional[bool], Optional[bool], Optional[bool]], QTextCharFormat] = {}
+_COLOR_FORMAT_CACHE: Dict[str, QTextCharFormat] = {}
+
+
+def _style_char_format(bold: Optional[bool], italic: Optional[bool], underline: Optional[bool]) -> QTextCharFormat:
+    key = (bold, italic, underline)
+    fmt = _STYLE_FORMAT_CACHE.get(key)
+    if fmt is None:
+        fmt = QTextCharFormat()
+        if bold is not None:
+            fmt.setFontWeight(QFont.Bold if bold else QFont.Normal)
+        if italic is not None:
+            fmt.setFontItalic(bool(italic))
+        if underline is not None:
+            fmt.setFontUnderline(bool(underline))
+        _STYLE_FORMAT_CACHE[key] = fmt
+    return fmt
+
+
+_LIST_FORMAT_CACHE: Dict[str, QTextListFormat] = {}
+
+
+def _list_format(kind: str) -> QTextListFormat:
+    """글머리(bullet)/번호(number) 리스트 포맷 공유 (createList가 값 복사)"""
+    fmt = _LIST_FORMAT_CACHE.get(kind)
+    if fmt is None:
+        fmt = QTextListFormat()
+        fmt.setStyle(QTextListFormat.ListDisc if kind == "bullet" else QTextListFormat.ListDecimal)
+        _LIST_FORMAT_CACHE[kind] = fmt
+    return fmt
+
+
+def _color_char_format(color_hex: str) -> QTextCharFormat:
+    fmt = _COLOR_FORMAT_CACHE.get(color_hex)
+    if fmt is None:
+        c = QColor(color_hex)
+        if not c.isValid():
+            c = QColor(COLOR_DEFAULT)
+        fmt = QTextCharFormat()
+        fmt.setForeground(QBrush(c))
+        _COLOR_FORMAT_CACHE[color_hex] = fmt
+    return fmt
+
+
+_COPY_ICON_CACHE: Dict[int, QIcon] = {}
+
+
 def _make_copy_icon(size: int = 16) -> QIcon:
+    """복사 아이콘 (크기별로 한 번만 그려서 공유)"""
+    icon = _COPY_ICON_CACHE.get(size)
+    if icon is None:
+        icon = _render_copy_icon(size)
+        _COPY_ICON_CACHE[size] = icon
+    return icon
+
+
+def _render_copy_icon(size: int) -> QIcon:
     """복사 아이콘: 두 개의 겹쳐진 사각형 (클립보드 모양)"""
     pm = QPixmap(size, size)
     pm.fill(Qt.transparent)
@@ -440,7 +584,20 @@ def _make_copy_icon(size: int = 16) -> QIcon:
     return QIcon(pm)
 
 
+_EXPAND_ICON_CACHE: Dict[Tuple[int, bool], QIcon] = {}
+
+
 def _make_expand_icon(size: int = 16, expanded: bool = False) -> QIcon:
+    """확장/축소 아이콘 (크기/상태별로 한 번만 그려서 공유)"""
+    key = (size, bool(expanded))
+    icon = _EXPAND_ICON_CACHE.get(key)
+    if icon is None:
+        icon = _render_expand_icon(size, bool(expanded))
+        _EXPAND_ICON_CACHE[key] = icon
+    return icon
+
+
+def _render_expand_icon(size: int, expanded: bool) -> QIcon:
     """사각형 안에 + 모양 확장/축소 아이콘 생성 (축소: +, 확장: -)"""
     pm = QPixmap(size, size)
     pm.fill(Qt.transparent)
@@ -525,100 +682,26 @@ class PlusTreeDelegate(QStyledItemDelegate):
             painter.restore()
 
 
-# ---------------------------
-# FlowLayout (auto wrap)
-# ---------------------------
-class FlowLayout(QLayout):
-    def __init__(self, parent=None, margin=0, spacing=-1):
-        super().__init__(parent)
-        if parent is not None:
-            self.setContentsMargins(margin, margin, margin, margin)
-        self.setSpacing(spacing)
-        self._item_list: List[QWidgetItem] = []
-
-    def addItem(self, item):
-        self._item_list.append(item)
-
-    def count(self):
-        return len(self._item_list)
-
-    def itemAt(self, index):
-        if 0 <= index < len(self._item_list):
-            return self._item_list[index]
-        return None
-
-    def takeAt(self, index):
-        if 0 <= index < len(self._item_list):
-            return self._item_list.pop(index)
-        return None
-
-    def expandingDirections(self):
-        return Qt.Orientations(Qt.Orientation(0))
-
-    def hasHeightForWidth(self):
-        return True
-
-    def heightForWidth(self, width):
-        return self._do_layout(QRect(0, 0, width, 0), test_only=True)
-
-    def setGeometry(self, rect):
-        super().setGeometry(rect)
-        self._do_layout(rect, test_only=False)
-
-    def sizeHint(self):
-        return self.minimumSize()
-
-    def minimumSize(self):
-        size = QSize()
-        for item in self._item_list:
-            size = size.expandedTo(item.minimumSize())
-        left, top, right, bottom = self.getContentsMargins()
-        size += QSize(left + right, top + bottom)
-        return size
-
-    def _do_layout(self, rect: QRect, test_only: bool) -> int:
-        left, top, right, bottom = self.getContentsMargins()
-        effective_rect = rect.adjusted(left, top, -right, -bottom)
-        x = effective_rect.x()
-        y = effective_rect.y()
-        line_height = 0
-
-        space_x = self.spacing()
-        space_y = self.spacing()
-        if space_x < 0:
-            space_x = 6
-        if space_y < 0:
-            space_y = 6
-
-        for item in self._item_list:
-            wid = item.widget()
-            if wid is not None and not wid.isVisible():
-                continue
-
-            item_size = item.sizeHint()
-            next_x = x + item_size.width() + space_x
-
-            if next_x - space_x > effective_rect.right() and line_height > 0:
-                x = effective_rect.x()
-                y = y + line_height + space_y
-                next_x = x + item_size.width() + space_x
-                line_height = 0
-
-            if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item_size))
-
-            x = next_x
-            line_height = max(line_height, item_size.height())
-
-        return (y + line_height - rect.y()) + bottom
-
-
 # ---------------------------
 # Collapsible caption overlay
 # ---------------------------
 class CollapsibleCaptionEdit(QPlainTextEdit):
     expandedChanged = pyqtSignal(bool)
 
+    # 모든 인스턴스가 같은 스타일 문자열 객체를 공유
+    STYLE_SHEET = """
+        QPlainTextEdit {
+            background: rgba(255,255,255,235);
+            border: 1px solid #9A9A9A;
+            border-radius: 8px;
+            padding: 6px 10px;
+            color: #222;
+        }
+        QPlainTextEdit:focus {
+            border: 1px solid #5A8DFF;
+        }
+    """
+
     def __init__(self, parent=None, collapsed_h: int = 32, expanded_h: int = 84):
         super().__init__(parent)
         self._collapsed_h = int(collapsed_h)
@@ -631,18 +714,7 @@ class CollapsibleCaptionEdit(QPlainTextEdit):
         self.setFrameShape(QFrame.NoFrame)
 
         self.setFixedHeight(self._collapsed_h)
-        self.setStyleSheet("""
-            QPlainTextEdit {
-                background: rgba(255,255,255,235);
-                border: 1px solid #9A9A9A;
-                border-radius: 8px;
-                padding: 6px 10px;
-                color: #222;
-            }
-            QPlainTextEdit:focus {
-                border: 1px solid #5A8DFF;
-            }
-        """)
+        self.setStyleSheet(self.STYLE_SHEET)
 
     def setPlaceholderTextCompat(self, text: str) -> None:
         try:
@@ -706,28 +778,62 @@ def _normalize_strokes(raw: Any) -> Strokes:
     if not raw:
         return []
     if isinstance(raw, list) and raw and isinstance(raw[0], dict):
+        # 로드 시 선 개수만큼 도는 루프: 전역/속성 조회를 지역 변수로
+        red = COLOR_RED
         out: Strokes = []
+        append = out.append
         for s in raw:
             try:
-                color = str(s.get("color", COLOR_RED))
-                width = float(s.get("width", 3.0))
                 pts = s.get("points", [])
-                if not isinstance(pts, list):
-                    pts = []
-                out.append({"color": color, "width": width, "points": pts})
+                append({
+                    "color": str(s.get("color", red)),
+                    "width": float(s.get("width", 3.0)),
+                    "points": pts if isinstance(pts, list) else [],
+                })
             except Exception:
                 continue
         return out
     if isinstance(raw, list) and (len(raw) == 0 or isinstance(raw[0], list)):
-        out2: Strokes = []
-        for stroke in raw:
-            if not isinstance(stroke, list):
-                continue
-            out2.append({"color": COLOR_RED, "width": 3.0, "points": stroke})
-        return out2
+        red = COLOR_RED
+        return [{"color": red, "width": 3.0, "points": stroke} for stroke in raw if isinstance(stroke, list)]
     return []
 
 
+def _simplify_polyline(xy: Any, epsilon: float) -> List[List[float]]:
+    """Ramer-Douglas-Peucker 단순화 (xy: [x0, y0, x1, y1, ...])"""
+    n = len(xy) // 2
+    if n <= 2:
+        return [[xy[2 * i], xy[2 * i + 1]] for i in range(n)]
+    eps2 = epsilon * epsilon
+    keep = [False] * n
+    keep[0] = keep[n - 1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        ax, ay = xy[2 * a], xy[2 * a + 1]
+        dx, dy = xy[2 * b] - ax, xy[2 * b + 1] - ay
+        seg2 = dx * dx + dy * dy
+        best_i = -1
+        best_d2 = eps2
+        for i in range(a + 1, b):
+            px, py = xy[2 * i] - ax, xy[2 * i + 1] - ay
+            if seg2 > 0.0:
+                cross = dx * py - dy * px
+                d2 = cross * cross / seg2
+            else:
+                d2 = px * px + py * py
+            if d2 > best_d2:
+                best_d2 = d2
+                best_i = i
+        if best_i >= 0:
+            keep[best_i] = True
+            if best_i - a > 1:
+                stack.append((a, best_i))
+            if b - best_i > 1:
+                stack.append((best_i, b))
+    return [[xy[2 * i], xy[2 * i + 1]] for i in range(n) if keep[i]]
+
+
 def _default_checklist() -> Checklist:
     return [{"q": q, "checked": False, "note": ""} for q in DEFAULT_CHECK_QUESTIONS]
 
@@ -763,7 +869,11 @@ def _normalize_custom_checklist(raw: Any) -> CustomChecklist:
     return out
 
 
-@dataclass
+# 모델 객체는 수가 많고 flush/직렬화에서 속성 접근이 잦으므로 __slots__ 사용 (dataclass slots는 3.10+)
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Page:
     id: str
     image_a_path: str
@@ -797,7 +907,38 @@ class Page:
     individual_holdings_b: int = 0  # 개인 보유 주식수 (주 단위)
 
 
-@dataclass
+# 저장 시 기본값과 같으면 생략하는 Page 필드 (대부분의 페이지는 B 이미지/종목 정보가 비어 있음)
+_PAGE_SPARSE_DEFAULTS: Tuple[Tuple[str, Any], ...] = (
+    ("image_a_path", ""),
+    ("image_b_path", ""),
+    ("image_a_caption", ""),
+    ("image_b_caption", ""),
+    ("strokes_a", []),
+    ("strokes_b", []),
+    ("note_text", ""),
+    ("stock_name", ""),
+    ("ticker", ""),
+    ("custom_checklist", []),
+    ("chart_type_a", "일봉"),
+    ("chart_type_b", "일봉"),
+    ("trading_amount_a", 0),
+    ("trading_amount_b", 0),
+    ("chart_year_a", 0),
+    ("chart_year_b", 0),
+    ("chart_month_a", 0),
+    ("chart_month_b", 0),
+    ("circulation_stock_a", 0),
+    ("circulation_stock_b", 0),
+    ("institution_holdings_a", 0),
+    ("institution_holdings_b", 0),
+    ("foreign_holdings_a", 0),
+    ("foreign_holdings_b", 0),
+    ("individual_holdings_a", 0),
+    ("individual_holdings_b", 0),
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Item:
     id: str
     name: str
@@ -810,7 +951,7 @@ class Item:
     distribution_ratio: int = 0  # 유통 비율 (0-100%, 최대 3자리)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Category:
     id: str
     name: str
@@ -831,6 +972,15 @@ class NoteDB:
         self.ui_state: Dict[str, Any] = {}
         self.global_ideas: List[Dict[str, str]] = []  # [{"name": str, "content": str}, ...] 최대 10개
         self.global_interests: List[Dict[str, str]] = []  # [{"name": str, "content": str}, ...] 최대 5개
+        # 증분 저장: 마지막 전체 저장 이후 변경된 아이템만 journal 파일에 기록
+        self.journal_path = f"{db_path}.journal.json"
+        self.dirty_item_ids: set = set()
+        self._full_save_needed: bool = False
+        self._journal_writes: int = 0
+        self._last_full_bytes: int = 0
+        # 마지막으로 기록된 본문 digest와 헤더(updated_at, save_id): 내용이 같으면 쓰기 생략
+        self._last_saved_digest: Optional[bytes] = None
+        self._last_saved_header: Tuple[Any, Any] = (None, None)
         self.load()
 
     @staticmethod
@@ -916,6 +1066,7 @@ class NoteDB:
                 # 현재 형식이면 정상 로드
                 if isinstance(temp_data, dict) and "categories" in temp_data:
                     self.data = temp_data
+                    self._apply_journal(self.data)
                     print(f"[DEBUG] JSON 로드 성공 - categories: {len(self.data.get('categories', []))}, items: {len(self.data.get('items', []))}")
                 else:
                     print(f"[DEBUG] 잘못된 형식 - 초기화")
@@ -1027,6 +1178,131 @@ class NoteDB:
         데이터 저장
         Returns: (success: bool, error_message: Optional[str])
         """
+        payload, error = self.snapshot_json()
+        if payload is None:
+            if error:
+                return False, error
+            return True, None
+
+        # 안전한 저장 (백업 포함)
+        result = _safe_write_bytes(self.db_path, payload, create_backup=True)
+        if result[0]:
+            print(f"[DEBUG] 저장 성공!")
+            self._remove_journal()
+        else:
+            print(f"[DEBUG] 저장 실패: {result[1]}")
+            self.mark_save_failed()
+        return result
+
+    def snapshot_json(self) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        백그라운드 저장용 스냅샷: GUI 스레드에서 JSON bytes까지 만들어 둠
+        (페이지 dict가 모델 리스트를 그대로 참조하므로 dict 자체를 넘기면 안 됨)
+        Returns: (json_bytes, error_message) - 마지막 저장과 내용이 같으면 (None, None)
+        """
+        ok, error = self._serialize_to_data()
+        if not ok:
+            return None, error
+        try:
+            payload = _dumps_json_bytes(self.data)
+        except Exception as e:
+            return None, f"Data is not JSON serializable: {str(e)}"
+        digest = _content_digest(payload)
+        if digest == self._last_saved_digest and os.path.exists(self.db_path):
+            # 파일에 있는 헤더를 유지해야 journal의 base_save_id가 맞음
+            self.data["updated_at"], self.data["save_id"] = self._last_saved_header
+            self._reset_journal_state()
+            return None, None
+        # 스냅샷 시점에 journal 상태 리셋 (쓰기 실패 시 호출자가 mark_save_failed)
+        self._reset_journal_state()
+        self._last_full_bytes = len(payload)
+        self._last_saved_digest = digest
+        self._last_saved_header = (self.data.get("updated_at"), self.data.get("save_id"))
+        return payload, None
+
+    def mark_item_dirty(self, item_id: str) -> None:
+        self.dirty_item_ids.add(item_id)
+
+    def mark_full_save_needed(self) -> None:
+        self._full_save_needed = True
+
+    def mark_save_failed(self) -> None:
+        """쓰기 실패: 다음 저장은 무조건 전체 저장"""
+        self._full_save_needed = True
+        self._last_saved_digest = None
+
+    def journal_snapshot(self) -> Optional[bytes]:
+        """
+        변경된 아이템 + ui_state만 담은 journal JSON bytes
+        조건이 맞지 않으면 None (호출자는 전체 저장으로 진행)
+        """
+        if self._full_save_needed or not self.dirty_item_ids:
+            return None
+        if self._journal_writes >= JOURNAL_MAX_WRITES or self._last_full_bytes <= 0:
+            return None
+        base_id = self.data.get("save_id") if isinstance(self.data, dict) else None
+        if not base_id or any(iid not in self.items for iid in self.dirty_item_ids):
+            return None
+        try:
+            payload = {
+                "base_save_id": base_id,
+                "updated_at": _now_epoch(),
+                "ui_state": self.ui_state.copy() if isinstance(self.ui_state, dict) else {},
+                "items": [self._serialize_item(self.items[iid]) for iid in sorted(self.dirty_item_ids)],
+            }
+            data = _dumps_json_bytes(payload, indent=False)
+        except Exception:
+            # 직렬화 실패 시 전체 저장으로 진행
+            return None
+        if len(data) > self._last_full_bytes * JOURNAL_MAX_RATIO:
+            return None
+        self._journal_writes += 1
+        # 디스크 상태가 본 파일과 달라지므로 다음 전체 저장은 생략하지 않음
+        self._last_saved_digest = None
+        return data
+
+    def _apply_journal(self, raw: Dict[str, Any]) -> None:
+        """로드 시 journal이 현재 본 파일 기준이면 변경 아이템을 덮어씀"""
+        try:
+            self._last_full_bytes = os.path.getsize(self.db_path)
+        except Exception:
+            self._last_full_bytes = 0
+        if not os.path.exists(self.journal_path):
+            return
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                journal = json.load(f)
+        except Exception as e:
+            print(f"[DEBUG] journal 로드 실패: {str(e)} - 무시")
+            return
+        if not isinstance(journal, dict) or journal.get("base_save_id") != raw.get("save_id"):
+            print("[DEBUG] journal 기준 불일치 - 무시")
+            return
+        updated = {str(d.get("id")): d for d in journal.get("items", []) if isinstance(d, dict)}
+        items = raw.get("items", [])
+        if isinstance(items, list):
+            raw["items"] = [updated.get(str(d.get("id")), d) if isinstance(d, dict) else d for d in items]
+        if isinstance(journal.get("ui_state"), dict):
+            raw["ui_state"] = journal["ui_state"]
+        # 다음 저장에서 본 파일로 통합
+        self._full_save_needed = True
+        print(f"[DEBUG] journal 적용 - items: {len(updated)}")
+
+    def _reset_journal_state(self) -> None:
+        self.dirty_item_ids = set()
+        self._full_save_needed = False
+        self._journal_writes = 0
+
+    def _remove_journal(self) -> None:
+        try:
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+        except Exception:
+            # 남은 journal은 save_id가 달라 다음 로드에서 무시됨
+            pass
+
+    def _serialize_to_data(self) -> Tuple[bool, Optional[str]]:
+        """무결성 검증 후 모델을 self.data로 직렬화"""
         print(f"[DEBUG] save() 시작 - db_path: {self.db_path}")
         print(f"[DEBUG] 저장 전 상태 - categories: {len(self.categories)}, items: {len(self.items)}, root_category_ids: {len(self.root_category_ids)}")
         
@@ -1042,7 +1318,6 @@ class NoteDB:
         self.data["version"] = "0.6.0"
         if "created_at" not in self.data:
             self.data["created_at"] = _now_epoch()
-        self.data["updated_at"] = _now_epoch()
         self.data["ui_state"] = self.ui_state.copy() if isinstance(self.ui_state, dict) else {}
         self.data["global_ideas"] = self.global_ideas.copy() if isinstance(self.global_ideas, list) else []
         self.data["global_interests"] = self.global_interests.copy() if isinstance(self.global_interests, list) else []
@@ -1060,22 +1335,20 @@ class NoteDB:
             return False, f"Failed to serialize categories: {str(e)}"
         
         try:
-            item_ids = self._all_item_ids_in_stable_order()
+            item_ids = self._all_item_ids_in_stable_order(category_ids)
             print(f"[DEBUG] 아이템 직렬화 시작 - 개수: {len(item_ids)}")
             self.data["items"] = [self._serialize_item(self.items[iid]) for iid in item_ids]
             print(f"[DEBUG] 아이템 직렬화 완료 - 저장된 개수: {len(self.data['items'])}")
         except Exception as e:
             print(f"[DEBUG] 아이템 직렬화 실패: {str(e)}")
             return False, f"Failed to serialize items: {str(e)}"
-        
-        # 안전한 저장 (백업 포함)
-        print(f"[DEBUG] _safe_write_json() 호출 시작")
-        result = _safe_write_json(self.db_path, self.data, create_backup=True)
-        if result[0]:
-            print(f"[DEBUG] 저장 성공!")
-        else:
-            print(f"[DEBUG] 저장 실패: {result[1]}")
-        return result
+
+        # 매 저장마다 바뀌는 헤더는 항상 마지막 키로 (_content_digest가 이 앞까지만 비교)
+        self.data.pop("updated_at", None)
+        self.data.pop("save_id", None)
+        self.data["updated_at"] = _now_epoch()
+        self.data["save_id"] = _uuid()
+        return True, None
 
     def _parse_categories_items(self, raw: Dict[str, Any]) -> None:
         """카테고리와 아이템 파싱 (현재 형식만 지원)"""
@@ -1186,38 +1459,20 @@ class NoteDB:
                     continue
 
     def _serialize_page(self, pg: Page) -> Dict[str, Any]:
-        return {
+        """기본값 필드는 생략 (로드 시 p.get(key, 기본값)으로 복원됨)"""
+        result: Dict[str, Any] = {
             "id": pg.id,
-            "image_a_path": pg.image_a_path,
-            "image_b_path": pg.image_b_path,
-            "image_a_caption": pg.image_a_caption,
-            "image_b_caption": pg.image_b_caption,
-            "strokes_a": pg.strokes_a,
-            "strokes_b": pg.strokes_b,
-            "note_text": pg.note_text,
-            "stock_name": pg.stock_name,
-            "ticker": pg.ticker,
-            "checklist": pg.checklist,
-            "custom_checklist": pg.custom_checklist,
             "created_at": pg.created_at,
             "updated_at": pg.updated_at,
-            "chart_type_a": pg.chart_type_a,
-            "chart_type_b": pg.chart_type_b,
-            "trading_amount_a": pg.trading_amount_a,
-            "trading_amount_b": pg.trading_amount_b,
-            "chart_year_a": pg.chart_year_a,
-            "chart_year_b": pg.chart_year_b,
-            "chart_month_a": pg.chart_month_a,
-            "chart_month_b": pg.chart_month_b,
-            "circulation_stock_a": pg.circulation_stock_a,
-            "circulation_stock_b": pg.circulation_stock_b,
-            "institution_holdings_a": pg.institution_holdings_a,
-            "institution_holdings_b": pg.institution_holdings_b,
-            "foreign_holdings_a": pg.foreign_holdings_a,
-            "foreign_holdings_b": pg.foreign_holdings_b,
-            "individual_holdings_a": pg.individual_holdings_a,
-            "individual_holdings_b": pg.individual_holdings_b,
         }
+        for key, default in _PAGE_SPARSE_DEFAULTS:
+            value = getattr(pg, key)
+            if value != default:
+                result[key] = value
+        # 체크리스트 질문은 DEFAULT_CHECK_QUESTIONS에서 복원되므로 체크/메모가 있을 때만 저장
+        if any(c.get("checked") or c.get("note") for c in pg.checklist):
+            result["checklist"] = pg.checklist
+        return result
 
     def _serialize_item(self, it: Item) -> Dict[str, Any]:
         result = {
@@ -1443,11 +1698,19 @@ class NoteDB:
             if it.category_id not in self.categories and root0:
                 it.category_id = root0
 
-        for cid, c in self.categories.items():
-            owned = [iid for iid, it in self.items.items() if it.category_id == cid]
+        # 카테고리별 소유 아이템을 한 번에 묶고, 멤버십은 set으로 확인 (O(C*I) → O(C+I))
+        owned_by_cat: Dict[str, List[str]] = {}
+        for iid, it in self.items.items():
+            owned_by_cat.setdefault(it.category_id, []).append(iid)
+        for cid, owned in owned_by_cat.items():
+            c = self.categories.get(cid)
+            if c is None:
+                continue
+            present = set(c.item_ids)
             for iid in owned:
-                if iid not in c.item_ids:
+                if iid not in present:
                     c.item_ids.append(iid)
+                    present.add(iid)
 
         # 아이템이 없어도 허용 (사용자가 모든 아이템을 삭제할 수 있도록)
         # if not self.items:
@@ -1492,10 +1755,13 @@ class NoteDB:
                 dfs(cid)
         return out
 
-    def _all_item_ids_in_stable_order(self) -> List[str]:
+    def _all_item_ids_in_stable_order(self, category_ids: Optional[List[str]] = None) -> List[str]:
+        """category_ids: 이미 구한 _all_category_ids_in_stable_order() 결과가 있으면 재사용"""
         out: List[str] = []
         seen = set()
-        for cid in self._all_category_ids_in_stable_order():
+        if category_ids is None:
+            category_ids = self._all_category_ids_in_stable_order()
+        for cid in category_ids:
             c = self.categories.get(cid)
             if not c:
                 continue
@@ -1582,30 +1848,29 @@ class NoteDB:
                 parent_id = None
         target = self.categories[parent_id] if parent_id else None
 
+        # 대상 목록의 중복 검사는 set으로 (하위 폴더/아이템 수만큼 리스트 in 검사 반복 방지)
+        child_list = target.child_ids if target else self.root_category_ids
+        child_seen = set(child_list)
         for ch_id in list(c.child_ids):
             ch = self.categories.get(ch_id)
             if not ch:
                 continue
             ch.parent_id = parent_id
-            if target:
-                if ch_id not in target.child_ids:
-                    target.child_ids.append(ch_id)
-            else:
-                if ch_id not in self.root_category_ids:
-                    self.root_category_ids.append(ch_id)
+            if ch_id not in child_seen:
+                child_list.append(ch_id)
+                child_seen.add(ch_id)
 
+        fallback_id = parent_id if parent_id else (self.root_category_ids[0] if self.root_category_ids else "")
+        dest = target if (parent_id and target) else self.categories.get(fallback_id) if fallback_id else None
+        dest_seen = set(dest.item_ids) if dest else set()
         for iid in list(c.item_ids):
             it = self.items.get(iid)
             if not it:
                 continue
-            it.category_id = parent_id if parent_id else (self.root_category_ids[0] if self.root_category_ids else "")
-            if parent_id and target:
-                if iid not in target.item_ids:
-                    target.item_ids.append(iid)
-            else:
-                root0 = self.root_category_ids[0] if self.root_category_ids else None
-                if root0 and iid not in self.categories[root0].item_ids:
-                    self.categories[root0].item_ids.append(iid)
+            it.category_id = fallback_id
+            if dest is not None and iid not in dest_seen:
+                dest.item_ids.append(iid)
+                dest_seen.add(iid)
 
         if parent_id and parent_id in self.categories:
             self.categories[parent_id].child_ids = [x for x in self.categories[parent_id].child_ids if x != cid]
@@ -1649,14 +1914,17 @@ class NoteDB:
         else:
             self.root_category_ids = [x for x in self.root_category_ids if x != cid]
 
-        for iid in set(to_delete_items):
-            it = self.items.get(iid)
-            if not it:
-                continue
-            cat = self.categories.get(it.category_id)
-            if cat:
-                cat.item_ids = [x for x in cat.item_ids if x != iid]
-            del self.items[iid]
+        # 삭제될 폴더에 속한 아이템은 목록 정리 불필요, 남는 폴더만 한 번씩 필터링
+        doomed_items = set(to_delete_items)
+        doomed_cats = set(to_delete_cats)
+        touched_cats = set()
+        for iid in doomed_items:
+            it = self.items.pop(iid, None)
+            if it and it.category_id not in doomed_cats and it.category_id in self.categories:
+                touched_cats.add(it.category_id)
+        for x in touched_cats:
+            cat = self.categories[x]
+            cat.item_ids = [i for i in cat.item_ids if i not in doomed_items]
 
         for x in reversed(to_delete_cats):
             if x in self.categories:
@@ -1758,6 +2026,7 @@ class NoteDB:
         try:
             # 1. 임시 디렉토리 생성
             import tempfile
+            import zipfile  # 내보내기/가져오기에서만 사용하므로 시작 시 로드하지 않음
             temp_dir = tempfile.mkdtemp()
             export_json_path = os.path.join(temp_dir, "notes_db.json")
             
@@ -1771,12 +2040,13 @@ class NoteDB:
             self.data["root_category_ids"] = list(self.root_category_ids)
             
             try:
-                self.data["categories"] = [self._serialize_category(self.categories[cid]) for cid in self._all_category_ids_in_stable_order()]
+                category_ids = self._all_category_ids_in_stable_order()
+                self.data["categories"] = [self._serialize_category(self.categories[cid]) for cid in category_ids]
             except Exception as e:
                 return False, f"Failed to serialize categories: {str(e)}"
             
             try:
-                self.data["items"] = [self._serialize_item(self.items[iid]) for iid in self._all_item_ids_in_stable_order()]
+                self.data["items"] = [self._serialize_item(self.items[iid]) for iid in self._all_item_ids_in_stable_order(category_ids)]
             except Exception as e:
                 return False, f"Failed to serialize items: {str(e)}"
             
@@ -1827,6 +2097,7 @@ class NoteDB:
             merge_mode: True면 병합, False면 덮어쓰기
         Returns: (success: bool, error_message: Optional[str])
         """
+        import zipfile
         try:
             import tempfile
             temp_dir = tempfile.mkdtemp()
@@ -1979,25 +2250,141 @@ class NoteDB:
 # ---------------------------
 # Image view with zoom/pan + strokes
 # ---------------------------
+def _pixmap_cache_key(abs_path: str) -> Optional[str]:
+    """경로+수정시각 QPixmapCache 키 (파일이 없으면 None)"""
+    try:
+        mtime = os.path.getmtime(abs_path)
+    except OSError:
+        return None
+    return f"tcn_img_{abs_path}|{mtime}"
+
+
+class _ImageLoadSignals(QObject):
+    loaded = pyqtSignal(int, str, QImage)  # (요청 번호, 캐시 키, 디코딩 결과)
+
+
+class _ImageLoadTask(QRunnable):
+    """차트 이미지 디코딩을 워커 스레드에서 수행 (QPixmap 변환은 GUI 스레드에서)"""
+
+    def __init__(self, request_id: int, abs_path: str, cache_key: str):
+        super().__init__()
+        self.request_id = request_id
+        self.abs_path = abs_path
+        self.cache_key = cache_key
+        self.signals = _ImageLoadSignals()
+
+    def run(self) -> None:
+        try:
+            img = QImage(self.abs_path)
+        except Exception:
+            img = QImage()
+        self.signals.loaded.emit(self.request_id, self.cache_key, img)
+
+
+class _ImageSaveSignals(QObject):
+    finished = pyqtSignal(bool, str)  # (성공 여부, 저장한 상대경로)
+
+
+class _ImageSaveTask(QRunnable):
+    """붙여넣은 이미지의 PNG 인코딩/쓰기를 워커 스레드에서 수행"""
+
+    def __init__(self, img: QImage, abs_path: str, rel_path: str):
+        super().__init__()
+        self.img = img
+        self.abs_path = abs_path
+        self.rel_path = rel_path
+        self.signals = _ImageSaveSignals()
+
+    def run(self) -> None:
+        try:
+            ok = bool(self.img.save(self.abs_path, "PNG", PASTE_PNG_QUALITY))
+        except Exception:
+            ok = False
+        self.signals.finished.emit(ok, self.rel_path)
+
+
+class LodPixmapItem(QGraphicsPixmapItem):
+    """축소 표시 시 미리 줄여둔 pixmap(QPixmapCache)을 그려서 매 페인트마다 원본 리샘플링 방지"""
+    LOD_WIDTHS = (512, 1024, 2048)
+
+    def _scaled(self, pm: QPixmap, width: int) -> QPixmap:
+        key = f"tcn_lod_{pm.cacheKey()}_{width}"
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            return cached
+        scaled = pm.scaledToWidth(width, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, scaled)
+        return scaled
+
+    def paint(self, painter, option, widget=None) -> None:
+        pm = self.pixmap()
+        if pm.isNull():
+            return
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        target_w = pm.width() * lod
+        src = pm
+        for w in self.LOD_WIDTHS:
+            if w < pm.width() and target_w <= w:
+                src = self._scaled(pm, w)
+                break
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, self.transformationMode() == Qt.SmoothTransformation)
+        off = self.offset()
+        painter.drawPixmap(QRectF(off.x(), off.y(), pm.width(), pm.height()), src, QRectF(src.rect()))
+
+
+# QPainterPath.reserve/capacity/clear는 Qt 5.13+ 에서만 제공
+_PATH_HAS_RESERVE = hasattr(QPainterPath, "reserve") and hasattr(QPainterPath, "capacity")
+_PATH_HAS_CLEAR = hasattr(QPainterPath, "clear")
+
+
 class ZoomPanAnnotateView(QGraphicsView):
     imageDropped = pyqtSignal(str)
     strokesChanged = pyqtSignal()
     transformChanged = pyqtSignal()  # 확대/축소 또는 변환 변경 시 발생
 
+    TAIL_FLUSH_POINTS = 32  # 꼬리 구간이 이 개수를 넘으면 본 경로에 합침
+    PATH_RESERVE_POINTS = 256  # 그리기 시작 시 경로 요소 미리 확보 (긴 선에서 재할당 반복 방지)
+
     def __init__(self) -> None:
         super().__init__()
         self.setAcceptDrops(True)
         self.setFocusPolicy(Qt.StrongFocus)
 
+        self._use_gl = USE_OPENGL_VIEWPORT and self._try_set_gl_viewport()
+
         self._scene = QGraphicsScene(self)
+        # 아이템이 이미지 1개 + 선 그룹뿐이므로 BSP 인덱스 유지 비용이 더 큼
+        self._scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self._scene)
 
         self._pixmap_item: Optional[QGraphicsPixmapItem] = None
+        self._pixmap_rect: Optional[QRectF] = None  # 현재 이미지 영역 (boundingRect 반복 호출 대신 사용)
         self._has_image: bool = False
+        # 백그라운드 이미지 로드 요청 번호 (다른 이미지가 설정되면 증가 → 늦게 끝난 로드는 무시)
+        self._image_request_id: int = 0
+        # 현재 표시 중인 이미지의 캐시 키 (같은 파일을 다시 설정하면 장면 재구성 생략)
+        self._shown_image_key: Optional[str] = None
 
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        # 배경은 뷰가 직접 단색으로 칠하므로 시스템 배경 채우기 생략
+        self.setBackgroundBrush(self.palette().base())
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        vp = self.viewport()
+        vp.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        vp.setAttribute(Qt.WA_NoSystemBackground, True)
+        if self._use_gl:
+            # GL viewport는 부분 갱신 이점이 없으므로 전체 갱신 + 안티앨리어싱
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+            self.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
+        else:
+            # 변경된 아이템 영역만 다시 그림 (선 그리기 중 전체 viewport 재페인트 방지)
+            # 안티앨리어싱을 쓰지 않으므로 DontAdjustForAntialiasing 안전
+            self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+            self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         self._zoom_factor_step = 1.25
+        self._scale = 1.0  # 현재 확대 배율 (transform().m11()을 매 이벤트마다 만들지 않도록 추적)
         self._min_scale = 0.05
         self._max_scale = 20.0
 
@@ -2009,19 +2396,47 @@ class ZoomPanAnnotateView(QGraphicsView):
 
         self._current_path: Optional[QPainterPath] = None
         self._current_item: Optional[QGraphicsPathItem] = None
-        self._current_points: List[List[float]] = []
+        # 그리는 중인 최근 구간만 담는 꼬리 아이템 (매 이동마다 전체 경로를 setPath 하지 않도록)
+        self._tail_path: Optional[QPainterPath] = None
+        self._tail_item: Optional[QGraphicsPathItem] = None
+        self._shift_path: QPainterPath = QPainterPath()  # SHIFT 직선용 경로 (매 이동마다 재사용)
+        # 그리는 중인 좌표 버퍼 [x0, y0, x1, y1, ...] (점마다 list/float 객체를 만들지 않도록)
+        self._current_xy: array = array("d")
+        # 마우스 이동 이벤트를 모았다가 이벤트 루프 한 바퀴마다 한 번에 처리
+        self._pending_moves: List[Tuple[QPointF, bool]] = []
+        self._drain_scheduled: bool = False
         self._stroke_start: Optional[QPointF] = None
         self._stroke_color_hex: str = COLOR_RED
         self._stroke_width: float = 3.0
 
         self._strokes: Strokes = []
-        self._stroke_items: List[QGraphicsPathItem] = []
+        # set_strokes 이후 선이 추가/삭제되었는지 (QTextDocument.isModified와 같은 용도)
+        self._strokes_modified: bool = False
+        # (색상, 두께)별로 모든 선을 하나의 경로 아이템에 합쳐서 그림
+        self._bucket_items: Dict[Tuple[str, float], QGraphicsPathItem] = {}
+        self._bucket_paths: Dict[Tuple[str, float], QPainterPath] = {}
+        self._strokes_group: Optional[QGraphicsItemGroup] = None  # 확정된 선들의 부모 (한 번에 추가/제거)
+        self._pen_cache: Dict[Tuple[str, float], QPen] = {}  # (색상, 두께) -> QPen
+
+        # 연속으로 그린 선들의 strokesChanged를 한 번으로 합쳐서 발생
+        self._strokes_emit_timer = QTimer(self)
+        self._strokes_emit_timer.setSingleShot(True)
+        self._strokes_emit_timer.timeout.connect(self.strokesChanged.emit)
         
         # 드래그 중 플래그 (드래그 중에는 위젯 위치 업데이트 방지)
         self._is_dragging: bool = False
 
         self.set_mode_pan()
 
+    def _try_set_gl_viewport(self) -> bool:
+        try:
+            from PyQt5.QtWidgets import QOpenGLWidget
+            self.setViewport(QOpenGLWidget())
+            return True
+        except Exception as e:
+            print(f"[DEBUG] OpenGL viewport 사용 불가, 기본 viewport 사용: {e}")
+            return False
+
     def set_pen(self, color_hex: str, width: float) -> None:
         c = QColor(color_hex)
         if not c.isValid():
@@ -2030,6 +2445,14 @@ class ZoomPanAnnotateView(QGraphicsView):
         self._pen_width = float(width)
 
     def _make_pen(self, color_hex: str, width: float) -> QPen:
+        key = (color_hex, float(width))
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = self._build_pen(color_hex, width)
+            self._pen_cache[key] = pen
+        return pen
+
+    def _build_pen(self, color_hex: str, width: float) -> QPen:
         c = QColor(color_hex)
         if not c.isValid():
             c = QColor(COLOR_RED)
@@ -2049,60 +2472,113 @@ class ZoomPanAnnotateView(QGraphicsView):
         self.viewport().setCursor(Qt.OpenHandCursor)
 
     def clear_image(self) -> None:
+        self._image_request_id += 1
         self._clear_strokes_internal(emit_signal=False)
         self._scene.clear()
         self._pixmap_item = None
+        self._pixmap_rect = None
+        self._shown_image_key = None
         self._has_image = False
         self.resetTransform()
+        self._scale = 1.0
         self.transformChanged.emit()
 
     def set_image_path(self, abs_path: str) -> None:
-        pm = QPixmap(abs_path)
+        """캐시에 있으면 바로 표시, 없으면 워커 스레드에서 디코딩 후 _on_image_loaded에서 표시"""
+        key = _pixmap_cache_key(abs_path)
+        if key is None:
+            self.clear_image()
+            return
+        if key == self._shown_image_key and self._pixmap_item is not None:
+            # 같은 파일(경로+수정시각)이 이미 떠 있음: 진행 중인 다른 로드만 무효화하고 뷰만 다시 맞춤
+            self._image_request_id += 1
+            self.fit_to_view()
+            return
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            self._set_pixmap(cached, key)
+            return
+        # 로드 중에는 이전 이미지를 그대로 두어 깜빡임을 막고, 선만 내려서 그리기는 막음
+        # (_has_image=False 동안 set_strokes는 선 목록만 보관 → _on_image_loaded에서 새 이미지와 함께 교체)
+        self._image_request_id += 1
+        self._shown_image_key = None
+        self._clear_strokes_internal(emit_signal=False)
+        self._has_image = False
+        task = _ImageLoadTask(self._image_request_id, abs_path, key)
+        task.signals.loaded.connect(self._on_image_loaded)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_image_loaded(self, request_id: int, cache_key: str, img: QImage) -> None:
+        pm = QPixmap() if img.isNull() else QPixmap.fromImage(img)
+        if pm.isNull():
+            if request_id == self._image_request_id:
+                # 디코딩 실패: 남아 있던 이전 이미지를 지우되 보관 중인 선 목록은 유지
+                strokes = self._strokes
+                modified = self._strokes_modified
+                self.clear_image()
+                self._strokes = strokes
+                self._strokes_modified = modified
+            return
+        # 늦게 끝난 로드도 캐시에는 넣어 둠 (페이지를 다시 열면 바로 표시)
+        QPixmapCache.insert(cache_key, pm)
+        if request_id != self._image_request_id:
+            return
+        # 로드를 기다리는 동안 set_strokes로 받은 선을 이미지 위에 다시 그림
+        strokes = self._strokes
+        modified = self._strokes_modified
+        self._set_pixmap(pm, cache_key)
+        self.set_strokes(strokes)
+        self._strokes_modified = modified
+
+    def set_image_qimage(self, img: QImage) -> None:
+        """이미 메모리에 있는 이미지(클립보드 등)를 파일 재디코딩 없이 표시"""
+        pm = QPixmap.fromImage(img)
         if pm.isNull():
             self.clear_image()
             return
         self._set_pixmap(pm)
 
-    def _set_pixmap(self, pm: QPixmap) -> None:
+    def _set_pixmap(self, pm: QPixmap, cache_key: Optional[str] = None) -> None:
+        self._image_request_id += 1
+        self._shown_image_key = cache_key
         self._clear_strokes_internal(emit_signal=False)
         self._scene.clear()
 
-        self._pixmap_item = self._scene.addPixmap(pm)
+        self._pixmap_item = LodPixmapItem(pm)
+        self._scene.addItem(self._pixmap_item)
         self._pixmap_item.setTransformationMode(Qt.SmoothTransformation)
         self._pixmap_item.setZValue(0)
 
         self._has_image = True
-        self._scene.setSceneRect(QRectF(pm.rect()))
-        self.resetTransform()
+        self._pixmap_rect = QRectF(pm.rect())
+        self._scene.setSceneRect(self._pixmap_rect)
+        # fit_to_view가 resetTransform + fitInView를 한 번에 처리
         self.fit_to_view()
 
     def fit_to_view(self) -> None:
-        if not self._pixmap_item:
+        rect = self._pixmap_rect
+        if not self._pixmap_item or rect is None:
             self.resetTransform()
+            self._scale = 1.0
             self.transformChanged.emit()
             return
-        rect = self._pixmap_item.boundingRect()
         if rect.isNull():
             return
         self.resetTransform()
         self.fitInView(rect, Qt.KeepAspectRatio)
+        self._scale = self.transform().m11()
         self.transformChanged.emit()
 
     def wheelEvent(self, event) -> None:
         if not self._has_image:
             return
-        current_scale = self.transform().m11()
-        if event.angleDelta().y() > 0:
-            target = current_scale * self._zoom_factor_step
-        else:
-            target = current_scale / self._zoom_factor_step
+        step = self._zoom_factor_step
+        factor = step if event.angleDelta().y() > 0 else 1.0 / step
+        target = self._scale * factor
         if target < self._min_scale or target > self._max_scale:
             return
-        if event.angleDelta().y() > 0:
-            self.scale(self._zoom_factor_step, self._zoom_factor_step)
-        else:
-            inv = 1.0 / self._zoom_factor_step
-            self.scale(inv, inv)
+        self.scale(factor, factor)
+        self._scale = target
         # 확대/축소 후 위젯 위치 업데이트를 위한 시그널 발생 (드래그 중이 아닐 때만)
         if not self._is_dragging:
             self.transformChanged.emit()
@@ -2162,43 +2638,77 @@ class ZoomPanAnnotateView(QGraphicsView):
     def get_strokes(self) -> Strokes:
         return self._strokes
 
+    def is_strokes_modified(self) -> bool:
+        return self._strokes_modified
+
+    def set_strokes_modified(self, modified: bool) -> None:
+        self._strokes_modified = bool(modified)
+
     def set_strokes(self, strokes: Strokes) -> None:
+        # 이전 페이지의 선은 modified 플래그로 이미 flush됨 → 대기 중인 strokesChanged는 새 페이지에 불필요한 저장만 유발
+        self._strokes_emit_timer.stop()
         self._clear_strokes_internal(emit_signal=False)
-        self._strokes = strokes or []
+        # 페이지 모델 리스트와 분리 (그리는 동안 모델이 직접 바뀌지 않도록)
+        self._strokes = list(strokes or [])
+        self._strokes_modified = False
         if not self._has_image:
             return
+        paths = self._bucket_paths
         for s in self._strokes:
             pts = s.get("points", [])
             if not isinstance(pts, list) or len(pts) < 2:
                 continue
-            color = str(s.get("color", COLOR_RED))
-            width = float(s.get("width", 3.0))
-            path = QPainterPath(QPointF(pts[0][0], pts[0][1]))
-            for pt in pts[1:]:
-                path.lineTo(QPointF(pt[0], pt[1]))
-            item = QGraphicsPathItem(path)
-            item.setPen(self._make_pen(color, width))
-            item.setZValue(10)
-            self._scene.addItem(item)
-            self._stroke_items.append(item)
+            key = (str(s.get("color", COLOR_RED)), float(s.get("width", 3.0)))
+            path = paths.get(key)
+            if path is None:
+                path = QPainterPath()
+                paths[key] = path
+            # 점마다 lineTo를 호출하지 않고 polygon 한 번으로 추가 (moveTo + lineTo와 동일한 서브패스)
+            path.addPolygon(QPolygonF([QPointF(pt[0], pt[1]) for pt in pts]))
+        if not paths:
+            return
+        for key, path in paths.items():
+            self._bucket_items[key] = self._new_bucket_item(key, path)
+
+    def _new_bucket_item(self, key: Tuple[str, float], path: QPainterPath) -> QGraphicsPathItem:
+        item = QGraphicsPathItem(path, self._ensure_strokes_group())
+        item.setPen(self._make_pen(key[0], key[1]))
+        if not self._use_gl:
+            # 확정된 선은 장치 좌표 pixmap으로 캐시 → 팬/다시 그리기 시 벡터 재래스터화 대신 blit
+            item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        return item
+
+    def _ensure_strokes_group(self) -> QGraphicsItemGroup:
+        if self._strokes_group is None:
+            group = QGraphicsItemGroup()
+            group.setZValue(10)
+            self._scene.addItem(group)
+            self._strokes_group = group
+        return self._strokes_group
 
     def clear_strokes(self) -> None:
         self._clear_strokes_internal(emit_signal=True)
 
     def _clear_strokes_internal(self, emit_signal: bool) -> None:
-        for it in list(self._stroke_items):
+        # 선 아이템들은 모두 그룹의 자식이므로 그룹만 제거
+        if self._strokes_group is not None:
             try:
-                self._scene.removeItem(it)
+                self._scene.removeItem(self._strokes_group)
             except Exception:
                 pass
-        self._stroke_items = []
+            self._strokes_group = None
+        self._bucket_items = {}
+        self._bucket_paths = {}
         self._strokes = []
+        self._remove_tail_item()
         self._is_drawing = False
         self._current_item = None
         self._current_path = None
-        self._current_points = []
+        self._current_xy = array("d")
+        self._pending_moves = []
         self._stroke_start = None
         if emit_signal:
+            self._strokes_modified = True
             self.strokesChanged.emit()
 
     def mousePressEvent(self, event) -> None:
@@ -2217,7 +2727,10 @@ class ZoomPanAnnotateView(QGraphicsView):
             if not self._point_inside_pixmap(scene_pos):
                 return
             shift = bool(event.modifiers() & Qt.ShiftModifier)
-            self._append_stroke(scene_pos, shift=shift)
+            self._pending_moves.append((scene_pos, shift))
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                QTimer.singleShot(0, self._drain_pending_moves)
             event.accept()
             return
         # 드래그 모드이고 마우스 버튼이 눌려있으면 드래그 중으로 간주
@@ -2228,15 +2741,16 @@ class ZoomPanAnnotateView(QGraphicsView):
 
     def mouseReleaseEvent(self, event) -> None:
         if self._draw_mode and self._is_drawing and event.button() == Qt.LeftButton:
+            self._drain_pending_moves()
             self._finish_stroke()
             event.accept()
             return
         super().mouseReleaseEvent(event)
 
     def _point_inside_pixmap(self, pt: QPointF) -> bool:
-        if not self._pixmap_item:
-            return False
-        return self._pixmap_item.boundingRect().contains(pt)
+        # 마우스 이동마다 호출되므로 boundingRect() 대신 _set_pixmap에서 저장한 영역 사용
+        rect = self._pixmap_rect
+        return rect is not None and rect.contains(pt)
 
     def _start_stroke(self, pt: QPointF) -> None:
         self._is_drawing = True
@@ -2244,36 +2758,136 @@ class ZoomPanAnnotateView(QGraphicsView):
         self._stroke_color_hex = self._pen_color.name().upper()
         self._stroke_width = float(self._pen_width)
         self._current_path = QPainterPath(pt)
-        self._current_points = [[float(pt.x()), float(pt.y())]]
+        if _PATH_HAS_RESERVE:
+            self._current_path.reserve(self.PATH_RESERVE_POINTS)
+        self._shift_path = QPainterPath()
+        self._current_xy = array("d", (pt.x(), pt.y()))
+        pen = self._make_pen(self._stroke_color_hex, self._stroke_width)
         item = QGraphicsPathItem(self._current_path)
-        item.setPen(self._make_pen(self._stroke_color_hex, self._stroke_width))
+        item.setPen(pen)
         item.setZValue(10)
         self._scene.addItem(item)
         self._current_item = item
+        self._tail_path = QPainterPath(pt)
+        tail = QGraphicsPathItem(self._tail_path)
+        tail.setPen(pen)
+        tail.setZValue(10)
+        self._scene.addItem(tail)
+        self._tail_item = tail
 
     def _append_stroke(self, pt: QPointF, shift: bool) -> None:
         if not self._current_item or not self._stroke_start:
             return
         if shift:
             start = self._stroke_start
-            path = QPainterPath(start)
-            path.lineTo(pt)
+            path = self._shift_path
+            x = pt.x()
+            y = pt.y()
+            if path is self._current_path and path.elementCount() == 2 and len(self._current_xy) == 4:
+                # 이미 직선 상태: 끝점만 이동 (경로/좌표 버퍼 재생성 없음)
+                path.setElementPositionAt(1, x, y)
+                buf = self._current_xy
+                buf[2] = x
+                buf[3] = y
+                # 꼬리(점 1개, 화면에 안 보임)의 시작점도 끝점에 맞춰 둠 → SHIFT 해제 후 자유선이 끝점에서 이어짐
+                tail = self._tail_path
+                if tail is not None and tail.elementCount() == 1:
+                    tail.setElementPositionAt(0, x, y)
+            else:
+                if _PATH_HAS_CLEAR:
+                    path.clear()
+                else:
+                    path = self._shift_path = QPainterPath()
+                path.moveTo(start)
+                path.lineTo(pt)
+                self._current_path = path
+                self._current_xy = array("d", (start.x(), start.y(), x, y))
+                # 꼬리는 직선으로 전환될 때 한 번만 비움
+                if self._tail_item:
+                    self._tail_path = QPainterPath(pt)
+                    self._tail_item.setPath(self._tail_path)
             self._current_item.setPath(path)
-            self._current_points = [[float(start.x()), float(start.y())], [float(pt.x()), float(pt.y())]]
+            return
+        self._extend_stroke([pt])
+
+    def _drain_pending_moves(self) -> None:
+        self._drain_scheduled = False
+        moves = self._pending_moves
+        if not moves:
+            return
+        self._pending_moves = []
+        if not self._is_drawing:
+            return
+        run: List[QPointF] = []
+        for pt, shift in moves:
+            if shift:
+                if run:
+                    self._extend_stroke(run)
+                    run = []
+                self._append_stroke(pt, shift=True)
+            else:
+                run.append(pt)
+        if run:
+            self._extend_stroke(run)
+
+    def _extend_stroke(self, pts: List[QPointF]) -> None:
+        """여러 점을 한 번에 이어 붙이고 setPath는 마지막에 한 번만"""
+        if not self._current_item or not self._stroke_start:
             return
         if not self._current_path:
             self._current_path = QPainterPath(self._stroke_start)
-        last = self._current_points[-1]
-        dx = pt.x() - last[0]
-        dy = pt.y() - last[1]
-        if (dx * dx + dy * dy) < 4.0:
+        path = self._current_path
+        tail = self._tail_path
+        buf = self._current_xy
+        # 화면상 2px 미만 이동은 버림 (축소 상태에서는 장면 좌표 기준 간격이 커짐)
+        scale = self._scale
+        min_dist_sq = max(4.0, (2.0 / scale) ** 2) if scale > 0 else 4.0
+        # 루프 안 속성 조회를 줄이도록 bound method/마지막 점을 지역 변수로
+        path_line_to = path.lineTo
+        tail_line_to = tail.lineTo if tail is not None else None
+        buf_append = buf.append
+        last_x = buf[-2]
+        last_y = buf[-1]
+        added = False
+        for pt in pts:
+            x = pt.x()
+            y = pt.y()
+            dx = x - last_x
+            dy = y - last_y
+            if (dx * dx + dy * dy) < min_dist_sq:
+                continue
+            path_line_to(pt)
+            if tail_line_to is not None:
+                tail_line_to(pt)
+            buf_append(x)
+            buf_append(y)
+            last_x = x
+            last_y = y
+            added = True
+        if not added:
+            return
+        if self._tail_item is None or tail is None:
+            self._current_item.setPath(path)
             return
-        self._current_path.lineTo(pt)
-        self._current_item.setPath(self._current_path)
-        self._current_points.append([float(pt.x()), float(pt.y())])
+        # 새 구간은 꼬리 아이템에만 반영 -> 갱신 영역이 최근 구간 크기로 제한됨
+        if tail.elementCount() > self.TAIL_FLUSH_POINTS:
+            if _PATH_HAS_RESERVE and path.elementCount() + self.TAIL_FLUSH_POINTS >= path.capacity():
+                path.reserve(path.elementCount() * 2)
+            self._current_item.setPath(path)
+            self._tail_path = QPainterPath(QPointF(buf[-2], buf[-1]))
+        self._tail_item.setPath(self._tail_path)
+
+    def _remove_tail_item(self) -> None:
+        if self._tail_item is not None:
+            try:
+                self._scene.removeItem(self._tail_item)
+            except Exception:
+                pass
+        self._tail_item = None
+        self._tail_path = None
 
     def _finish_stroke(self) -> None:
-        if not self._current_item or len(self._current_points) < 2:
+        if not self._current_item or len(self._current_xy) < 4:
             if self._current_item:
                 try:
                     self._scene.removeItem(self._current_item)
@@ -2281,16 +2895,44 @@ class ZoomPanAnnotateView(QGraphicsView):
                     pass
             self._reset_current()
             return
-        self._stroke_items.append(self._current_item)
-        self._strokes.append({"color": self._stroke_color_hex, "width": self._stroke_width, "points": self._current_points})
+        self._remove_tail_item()
+        self._fold_current_into_bucket()
+        # 거의 일직선인 중간 점들을 제거해 저장 크기/다시 그리기 비용을 줄임
+        points = [
+            [round(x, STROKE_COORD_DECIMALS), round(y, STROKE_COORD_DECIMALS)]
+            for x, y in _simplify_polyline(self._current_xy, STROKE_SIMPLIFY_EPSILON)
+        ]
+        self._strokes.append({"color": self._stroke_color_hex, "width": self._stroke_width, "points": points})
+        self._strokes_modified = True
         self._reset_current()
-        self.strokesChanged.emit()
+        self._strokes_emit_timer.start(200)
+
+    def _fold_current_into_bucket(self) -> None:
+        """그리기를 마친 선을 같은 펜의 묶음 경로로 합치고 임시 아이템 제거"""
+        key = (self._stroke_color_hex, self._stroke_width)
+        path = self._bucket_paths.get(key)
+        if path is None:
+            path = QPainterPath()
+            self._bucket_paths[key] = path
+        if self._current_path is not None:
+            path.addPath(self._current_path)
+        item = self._bucket_items.get(key)
+        if item is None:
+            self._bucket_items[key] = self._new_bucket_item(key, path)
+        else:
+            item.setPath(path)
+        try:
+            self._scene.removeItem(self._current_item)
+        except Exception:
+            pass
 
     def _reset_current(self) -> None:
+        self._remove_tail_item()
         self._is_drawing = False
         self._current_item = None
         self._current_path = None
-        self._current_points = []
+        self._current_xy = array("d")
+        self._pending_moves = []
         self._stroke_start = None
 
 
@@ -2451,6 +3093,53 @@ class ExpandableTreeWidget(QTreeWidget):
         super().mouseDoubleClickEvent(event)
 
 
+# ---------------------------
+# Background DB writer
+# ---------------------------
+class _DbWriteSignals(QObject):
+    finished = pyqtSignal(bool, str)
+
+
+class _DbWriteTask(QRunnable):
+    """GUI 스레드에서 만든 JSON bytes를 워커 스레드에서 디스크에 기록"""
+
+    def __init__(self, path: str, payload: bytes, is_journal: bool = False, journal_path: Optional[str] = None):
+        super().__init__()
+        self.path = path
+        self.payload = payload
+        self.is_journal = is_journal
+        self.journal_path = journal_path  # 전체 저장 성공 후 삭제할 journal
+        self.signals = _DbWriteSignals()
+
+    def run(self) -> None:
+        try:
+            ok, error = _safe_write_bytes(self.path, self.payload, create_backup=not self.is_journal)
+            if ok and self.journal_path and os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+        except Exception as e:
+            ok, error = False, f"Unexpected error: {str(e)}"
+        self.signals.finished.emit(bool(ok), error or "")
+
+
+# ---------------------------
+# Rich edit event filter
+# ---------------------------
+class _RichEditFilter(QObject):
+    """서식 편집기 전용 이벤트 필터: FocusIn/KeyPress만 MainWindow로 전달"""
+
+    def __init__(self, owner: "MainWindow") -> None:
+        super().__init__(owner)
+        self._owner = owner
+
+    def eventFilter(self, obj, event) -> bool:
+        t = event.type()
+        if t == QEvent.FocusIn:
+            self._owner._set_active_rich_edit(obj)
+        elif t == QEvent.KeyPress:
+            return self._owner._handle_rich_edit_key(obj, event)
+        return False
+
+
 # ---------------------------
 # Main Window
 # ---------------------------
@@ -2460,6 +3149,11 @@ class MainWindow(QMainWindow):
     NODE_TYPE_ROLE = Qt.UserRole + 203  # "category" or "item"
 
     TRACE_MAX_LINES = 1200
+    DIRTY_FIELD_PROP = "tcn_dirty_field"  # 위젯 -> 변경 필드 키 (Qt dynamic property)
+    DIRTY_ALL = "*"  # 어느 필드인지 모를 때: 전체 다시 읽기
+    RICH_HTML_PROP = "tcn_rich_html"  # 편집기 → 마지막으로 로드/수집한 HTML (수정 없으면 toHtml 생략)
+    PANE_STYLE_ACTIVE = "border: 2px solid #5A8DFF;"
+    PANE_STYLE_INACTIVE = "border: 1px solid #D0D0D0;"
 
     def __init__(self) -> None:
         super().__init__()
@@ -2478,9 +3172,12 @@ class MainWindow(QMainWindow):
         self.current_item_id: str = ""
         self.current_page_index: int = 0
         self._loading_ui: bool = False
+        # 마지막 flush 이후 변경된 필드 키들 (flush 시 이 필드만 위젯에서 다시 읽음)
+        self._dirty_fields: set = set()
         self._adjusting_splitter: bool = False  # Description 토글 중 splitter 크기 조정 플래그
 
         self._active_rich_edit: Optional[QTextEdit] = None
+        self._rich_edit_filter = _RichEditFilter(self)
         self._desc_visible: bool = bool(self.db.ui_state.get("desc_visible", True))
         self._page_split_prev_sizes: Optional[List[int]] = None
         self._notes_split_prev_sizes: Optional[List[int]] = None
@@ -2488,6 +3185,8 @@ class MainWindow(QMainWindow):
         self.viewer_a: Optional[ZoomPanAnnotateView] = None
         self.viewer_b: Optional[ZoomPanAnnotateView] = None
         self._active_pane: str = "A"
+        # eventFilter용 (뷰포트, 페인, 뷰어): 이벤트마다 viewport()를 다시 조회하지 않음
+        self._viewport_panes: List[Tuple[QWidget, str, ZoomPanAnnotateView]] = []
 
         self._trace_visible: bool = bool(self.db.ui_state.get("trace_visible", True))
         self._right_vsplit_prev_sizes: Optional[List[int]] = None
@@ -2496,10 +3195,43 @@ class MainWindow(QMainWindow):
         self._save_timer.setSingleShot(True)
         self._save_timer.timeout.connect(self._flush_page_fields_to_model_and_save)
 
+        # 서식 버튼 동기화: 방향키/입력마다 오는 cursorPositionChanged를 30ms 단위로 합침
+        self._format_sync_timer = QTimer(self)
+        self._format_sync_timer.setSingleShot(True)
+        self._format_sync_timer.setInterval(30)
+        self._format_sync_timer.timeout.connect(self._sync_format_buttons)
+
+        # 디스크 저장 debounce: 연속된 변경을 한 번의 JSON 쓰기로 합침
+        self._db_save_timer = QTimer(self)
+        self._db_save_timer.setSingleShot(True)
+        self._db_save_timer.timeout.connect(self._save_db_in_background)
+
+        # 백그라운드 쓰기는 한 번에 하나만; 진행 중 요청은 끝난 뒤 최신 상태로 한 번 더 저장
+        self._db_write_pool = QThreadPool(self)
+        self._db_write_pool.setMaxThreadCount(1)
+        self._db_write_running: bool = False
+        self._db_write_pending: bool = False
+
+        # 클립보드 이미지 PNG 저장 (워커 스레드). 상대경로 → (item id, page id, pane)
+        # 모델 경로는 쓰기가 끝난 뒤에만 바뀌고, 그동안 화면에만 표시 중인 붙여넣기는 pane → 상대경로로 추적
+        self._image_save_pool = QThreadPool(self)
+        # 붙여넣은 순서대로 완료되어야 마지막 붙여넣기가 모델에 남음
+        self._image_save_pool.setMaxThreadCount(1)
+        # 상대경로 → (item id, page id, pane, 화면에서 내려갈 때 보관한 선 목록)
+        self._pending_clip_saves: Dict[str, Tuple[str, str, str, Optional[Strokes]]] = {}
+        self._clip_shown: Dict[str, str] = {}
+
+        self._delete_folder_msg: Optional[Tuple[QMessageBox, QPushButton, QPushButton, QPushButton]] = None
+
         self._last_save_warn_ts: float = 0.0
         self._save_warn_cooldown_sec: float = 10.0
 
         self._pane_ui: Dict[str, Dict[str, Any]] = {}
+        self._overlay_reposition_timers: Dict[str, QTimer] = {}
+        # _refresh_nav_tree가 채우는 id → 트리 행 맵
+        self._nav_item_qitems: Dict[str, QTreeWidgetItem] = {}
+        self._nav_cat_qitems: Dict[str, QTreeWidgetItem] = {}
+        self._nav_prev_state: Optional[Tuple[int, int]] = None  # _update_nav가 마지막으로 반영한 (현재 페이지, 전체)
 
         self._build_ui()
         self._build_pane_overlays()
@@ -2532,7 +3264,6 @@ class MainWindow(QMainWindow):
             self._show_placeholder(True)
             self._load_current_item_page_to_ui(clear_only=True)
 
-        self._load_global_ideas_to_ui()
         self._load_global_interests_to_ui()
         self._update_recent_items_list()  # 최근 작업 리스트 초기화
 
@@ -2669,13 +3400,19 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:
         try:
+            # 붙여넣기 PNG 쓰기가 끝난 뒤에 마지막 DB 저장 (DB가 아직 없는 파일을 가리키지 않도록)
+            self._image_save_pool.waitForDone()
+            # 큐에 쌓인 완료 시그널은 종료 전에 처리되지 않으므로 남은 항목은 파일 존재로 직접 판정
+            for dst_rel in list(self._pending_clip_saves):
+                dst_abs = _abspath_from_rel(dst_rel)
+                self._on_clip_image_saved(os.path.isfile(dst_abs) and os.path.getsize(dst_abs) > 0, dst_rel)
             self._remember_right_vsplit_sizes()
             self._flush_page_fields_to_model_and_save()
             # 트리 확장 상태 저장
             self._save_tree_expanded_state()
             # UI 상태 저장 및 DB 저장
             self._save_ui_state()
-            self._save_db_with_warning()
+            self._save_db_with_warning(immediate=True)
         except Exception:
             pass
         super().closeEvent(event)
@@ -2915,6 +3652,7 @@ class MainWindow(QMainWindow):
         # 작업 리스트 영역
         self.recent_items_list = QListWidget()
         self.recent_items_list.setMaximumHeight(200)
+        self.recent_items_list.setUniformItemSizes(True)  # 모든 항목이 2줄 고정 높이
         self.recent_items_list.itemClicked.connect(self._on_recent_item_clicked)
         left_layout.addWidget(self.recent_items_list)
 
@@ -2964,6 +3702,7 @@ class MainWindow(QMainWindow):
         
         self.edit_stock_name = QLineEdit()
         self.edit_stock_name.setFixedSize(220, 26)
+        self.edit_stock_name.setProperty(self.DIRTY_FIELD_PROP, "name")
         self.edit_stock_name.textChanged.connect(self._on_page_field_changed)
         left_meta_layout.addWidget(self.edit_stock_name)
         
@@ -2974,6 +3713,7 @@ class MainWindow(QMainWindow):
         
         self.edit_ticker = QLineEdit()
         self.edit_ticker.setFixedSize(120, 26)
+        self.edit_ticker.setProperty(self.DIRTY_FIELD_PROP, "ticker")
         self.edit_ticker.textChanged.connect(self._on_page_field_changed)
         left_meta_layout.addWidget(self.edit_ticker)
         
@@ -3054,8 +3794,10 @@ class MainWindow(QMainWindow):
         paneA_l.addWidget(barA)
         self.viewer_a = ZoomPanAnnotateView()
         self.viewer_a.imageDropped.connect(lambda p: self._on_image_dropped("A", p))
+        self.viewer_a.setProperty(self.DIRTY_FIELD_PROP, "strokes_a")
         self.viewer_a.strokesChanged.connect(self._on_page_field_changed)
         self.viewer_a.viewport().installEventFilter(self)
+        self._viewport_panes.append((self.viewer_a.viewport(), "A", self.viewer_a))
         paneA_l.addWidget(self.viewer_a, 1)
 
         # Pane B
@@ -3110,8 +3852,10 @@ class MainWindow(QMainWindow):
         paneB_l.addWidget(barB)
         self.viewer_b = ZoomPanAnnotateView()
         self.viewer_b.imageDropped.connect(lambda p: self._on_image_dropped("B", p))
+        self.viewer_b.setProperty(self.DIRTY_FIELD_PROP, "strokes_b")
         self.viewer_b.strokesChanged.connect(self._on_page_field_changed)
         self.viewer_b.viewport().installEventFilter(self)
+        self._viewport_panes.append((self.viewer_b.viewport(), "B", self.viewer_b))
         paneB_l.addWidget(self.viewer_b, 1)
 
         self.dual_view_splitter.addWidget(paneA)
@@ -3122,7 +3866,10 @@ class MainWindow(QMainWindow):
         img_layout.addWidget(self.dual_view_splitter, 1)
 
         nav_widget = QWidget()
-        nav_flow = FlowLayout(nav_widget, margin=0, spacing=6)
+        # 버튼 5개뿐이라 줄바꿈이 필요 없음 -> 고정 가로 배치
+        nav_flow = QHBoxLayout(nav_widget)
+        nav_flow.setContentsMargins(0, 0, 0, 0)
+        nav_flow.setSpacing(6)
         self.btn_prev = QToolButton(); self.btn_prev.setText("◀"); self.btn_prev.setFixedSize(32, 26); self.btn_prev.setToolTip("Previous Page"); self.btn_prev.clicked.connect(self.go_prev_page)
         self.lbl_page = QLabel("0 / 0"); self.lbl_page.setAlignment(Qt.AlignCenter); self.lbl_page.setMinimumWidth(80)
         self.btn_next = QToolButton(); self.btn_next.setText("▶"); self.btn_next.setFixedSize(32, 26); self.btn_next.setToolTip("Next Page"); self.btn_next.clicked.connect(self.go_next_page)
@@ -3130,6 +3877,7 @@ class MainWindow(QMainWindow):
         self.btn_del_page = QToolButton(); self.btn_del_page.setText("×"); self.btn_del_page.setFixedSize(32, 26); self.btn_del_page.setToolTip("Delete Page"); self.btn_del_page.clicked.connect(self.delete_page)
         for w in [self.btn_prev, self.lbl_page, self.btn_next, self.btn_add_page, self.btn_del_page]:
             nav_flow.addWidget(w)
+        nav_flow.addStretch()
         img_layout.addWidget(nav_widget)
 
         # -------- Text (Description + checklist + ideas) --------
@@ -3192,6 +3940,13 @@ class MainWindow(QMainWindow):
 
         for idx, btn in enumerate([self.btn_col_default, self.btn_col_red, self.btn_col_blue, self.btn_col_yellow]):
             self._color_group.addButton(btn, idx)
+        # 커서 이동마다 QColor를 만들지 않도록 색상 hex → 버튼 매핑을 한 번만 계산
+        self._color_btn_by_hex: Dict[str, QToolButton] = {
+            QColor(COLOR_DEFAULT).name().upper(): self.btn_col_default,
+            QColor(COLOR_RED).name().upper(): self.btn_col_red,
+            QColor(COLOR_BLUE).name().upper(): self.btn_col_blue,
+            QColor(COLOR_YELLOW).name().upper(): self.btn_col_yellow,
+        }
 
         self.btn_col_default.toggled.connect(lambda v: v and self._apply_text_color(COLOR_DEFAULT))
         self.btn_col_red.toggled.connect(lambda v: v and self._apply_text_color(COLOR_RED))
@@ -3316,6 +4071,7 @@ class MainWindow(QMainWindow):
         for q in DEFAULT_CHECK_QUESTIONS:
             cb = QCheckBox(q)
             # 체크 상태에 따라 질문 텍스트 색상 변경
+            cb.setProperty(self.DIRTY_FIELD_PROP, "checklist")
             cb.stateChanged.connect(self._on_page_field_changed)
             cb.stateChanged.connect(lambda state, checkbox=cb: self._update_checkbox_color(checkbox, state))
             # 초기 스타일 설정
@@ -3331,10 +4087,7 @@ class MainWindow(QMainWindow):
             note = QTextEdit()
             note.setPlaceholderText("간단 설명을 입력하세요... (서식/색상 가능)")
             note.setFixedHeight(54)
-            note.textChanged.connect(self._on_page_field_changed)
-            note.installEventFilter(self)
-            note.cursorPositionChanged.connect(self._on_any_rich_cursor_changed)
-            note.setTabChangesFocus(False)
+            self._wire_rich_edit(note, "checklist")
             self.chk_notes.append(note)
             chk_default_layout.addWidget(cb)
             chk_default_layout.addWidget(note)
@@ -3370,10 +4123,7 @@ class MainWindow(QMainWindow):
 
         self.text_edit = QTextEdit()
         self.text_edit.setPlaceholderText("추가 분석/설명을 자유롭게 작성하세요... (서식/색상 가능)")
-        self.text_edit.textChanged.connect(self._on_page_field_changed)
-        self.text_edit.installEventFilter(self)
-        self.text_edit.cursorPositionChanged.connect(self._on_any_rich_cursor_changed)
-        self.text_edit.setTabChangesFocus(False)
+        self._wire_rich_edit(self.text_edit, "note_text")
 
         notes_left_l.addWidget(self.chk_tabs)
         notes_left_l.addWidget(self.text_edit, 1)
@@ -3425,6 +4175,8 @@ class MainWindow(QMainWindow):
         
         # Ideas 탭 데이터 저장
         self.ideas_tab_editors: List[QTextEdit] = []  # 각 탭의 QTextEdit 저장
+        # Ideas 탭 편집기(최대 10개 QTextEdit + HTML 파싱)는 패널을 처음 열 때 생성
+        self._ideas_loaded: bool = False
 
         # Interest 패널
         self.interests_panel = QFrame()
@@ -3620,8 +4372,9 @@ class MainWindow(QMainWindow):
         
         edit_cap = CollapsibleCaptionEdit(caption_container, collapsed_h=32, expanded_h=84)
         edit_cap.setPlaceholderTextCompat(f"{pane} 이미지 간단 설명 (hover/클릭 시 2~3줄 확장)")
+        edit_cap.setProperty(self.DIRTY_FIELD_PROP, f"pane_{pane}")
         edit_cap.textChanged.connect(self._on_page_field_changed)
-        edit_cap.expandedChanged.connect(lambda _: self._reposition_overlay(pane))
+        edit_cap.expandedChanged.connect(partial(self._schedule_reposition_overlay, pane))
         caption_container_layout.addWidget(edit_cap, 1)  # Caption은 확장 가능
         
         # 년도/월 선택 ComboBox
@@ -3639,6 +4392,7 @@ class MainWindow(QMainWindow):
         combo_year.insertItem(0, "-", 0)  # 첫 번째 항목: 미선택
         combo_year.setCurrentIndex(0)
         combo_year.setFixedWidth(70)
+        combo_year.setProperty(self.DIRTY_FIELD_PROP, f"pane_{pane}")
         combo_year.currentIndexChanged.connect(self._on_page_field_changed)
         date_layout.addWidget(combo_year)
         
@@ -3649,6 +4403,7 @@ class MainWindow(QMainWindow):
             combo_month.addItem(f"{month}월", month)
         combo_month.setCurrentIndex(0)
         combo_month.setFixedWidth(60)
+        combo_month.setProperty(self.DIRTY_FIELD_PROP, f"pane_{pane}")
         combo_month.currentIndexChanged.connect(self._on_page_field_changed)
         date_layout.addWidget(combo_month)
         
@@ -3673,6 +4428,7 @@ class MainWindow(QMainWindow):
         combo_chart_type = QComboBox(trading_info_widget)
         combo_chart_type.addItems(["일봉", "분봉"])
         combo_chart_type.setFixedWidth(60)
+        combo_chart_type.setProperty(self.DIRTY_FIELD_PROP, f"pane_{pane}")
         combo_chart_type.currentTextChanged.connect(self._on_page_field_changed)
         trading_info_layout.addWidget(combo_chart_type)
         
@@ -3681,6 +4437,7 @@ class MainWindow(QMainWindow):
         edit_trading_amount.setPlaceholderText("거래대금")
         edit_trading_amount.setFixedWidth(65)  # 만 단위(5자리)에 맞춘 너비
         edit_trading_amount.setValidator(QIntValidator(0, 99999))
+        edit_trading_amount.setProperty(self.DIRTY_FIELD_PROP, f"pane_{pane}")
         edit_trading_amount.textChanged.connect(self._on_page_field_changed)
         trading_info_layout.addWidget(edit_trading_amount)
         
@@ -3895,7 +4652,8 @@ class MainWindow(QMainWindow):
         holdings_info_widget.setVisible(False)
         
         # 확대/축소 시 위젯 위치 업데이트
-        viewer.transformChanged.connect(lambda: self._reposition_overlay(pane))
+        # 휠/드래그마다 발생하므로 이벤트 루프 한 바퀴 단위로 합쳐서 한 번만 재배치
+        viewer.transformChanged.connect(partial(self._schedule_reposition_overlay, pane))
 
         # 주식 보유 정보 토글 버튼 (상단 우측)
         btn_holdings_toggle = QToolButton(vp)
@@ -3921,6 +4679,44 @@ class MainWindow(QMainWindow):
 
         # Notes 버튼 제거 - 이제 splitter 핸들에 화살표 버튼 사용
 
+        # Annotate 패널은 처음 열 때 생성 (_ensure_anno_panel)
+        btn_anno_toggle.clicked.connect(lambda: self._open_anno_panel(pane))
+
+        self._reposition_overlay(pane)
+
+        return {
+            "viewer": viewer,
+            "cap": edit_cap,
+            "caption_container": caption_container,
+            "year": combo_year,
+            "month": combo_month,
+            "trading_info": trading_info_widget,
+            "chart_type": combo_chart_type,
+            "trading_amount": edit_trading_amount,
+            "trading_status": lbl_status,
+            "holdings_info": holdings_info_widget,
+            "circulation_stock": edit_circulation,
+            "circulation_ratio": lbl_circulation_ratio_value,
+            "institution_holdings": holdings_rows[0]["edit"],
+            "foreign_holdings": holdings_rows[1]["edit"],
+            "individual_holdings": holdings_rows[2]["edit"],
+            "holdings_toggle": btn_holdings_toggle,
+            "anno_toggle": btn_anno_toggle,
+            # desc_toggle 제거됨 - splitter 핸들 버튼 사용
+            "panel": None,  # 지연 생성
+            "draw": None,
+        }
+
+    def _ensure_anno_panel(self, pane: str) -> Optional[QFrame]:
+        """Annotate 패널 지연 생성 (처음 열 때 한 번만)"""
+        ui = self._pane_ui.get(pane, {})
+        if not ui:
+            return None
+        if ui.get("panel") is not None:
+            return ui["panel"]
+        viewer: ZoomPanAnnotateView = ui["viewer"]
+        vp = viewer.viewport()
+
         anno_panel = QFrame(vp)
         anno_panel.setFrameShape(QFrame.StyledPanel)
         anno_panel.setVisible(False)
@@ -4018,11 +4814,11 @@ class MainWindow(QMainWindow):
         p_layout.addWidget(color_row)
         
         # 색상 선택 함수
-        def on_color_changed(btn_id: int):
-            color_hex = color_map.get(btn_id, COLOR_RED)
+        def on_color_changed(btn):
+            color_hex = color_map.get(color_group.id(btn), COLOR_RED)
             viewer.set_pen(color_hex, float(combo_width.currentData()))
         
-        color_group.buttonClicked.connect(lambda btn: on_color_changed(color_group.id(btn)))
+        color_group.buttonClicked.connect(on_color_changed)
 
         width_row = QWidget(anno_panel)
         width_l = QHBoxLayout(width_row)
@@ -4039,7 +4835,7 @@ class MainWindow(QMainWindow):
         btn_clear_lines = QPushButton("Clear Lines", anno_panel)
         p_layout.addWidget(btn_clear_lines)
 
-        def apply_pen():
+        def apply_pen(*_):
             # 현재 선택된 색상 버튼의 색상 가져오기
             checked_btn = color_group.checkedButton()
             if checked_btn:
@@ -4049,7 +4845,7 @@ class MainWindow(QMainWindow):
                 color_hex = COLOR_RED  # 기본값
             viewer.set_pen(color_hex, float(combo_width.currentData()))
 
-        combo_width.currentIndexChanged.connect(lambda _: apply_pen())
+        combo_width.currentIndexChanged.connect(apply_pen)
         apply_pen()
 
         def toggle_draw(checked: bool):
@@ -4081,47 +4877,35 @@ class MainWindow(QMainWindow):
 
         btn_clear_lines.clicked.connect(clear_lines)
 
-        def open_panel():
-            self._set_active_pane(pane)
-            btn_anno_toggle.setVisible(False)
-            anno_panel.setVisible(True)
-            self._reposition_overlay(pane)
+        btn_anno_close.clicked.connect(lambda: self._close_anno_panel(pane))
 
-        def close_panel():
-            if btn_draw_mode.isChecked():
-                btn_draw_mode.setChecked(False)
-                viewer.set_mode_pan()
-            anno_panel.setVisible(False)
-            btn_anno_toggle.setVisible(True)
-            self._reposition_overlay(pane)
-
-        btn_anno_toggle.clicked.connect(open_panel)
-        btn_anno_close.clicked.connect(close_panel)
+        ui["panel"] = anno_panel
+        ui["draw"] = btn_draw_mode
+        return anno_panel
 
+    def _open_anno_panel(self, pane: str) -> None:
+        anno_panel = self._ensure_anno_panel(pane)
+        if anno_panel is None:
+            return
+        self._set_active_pane(pane)
+        self._pane_ui[pane]["anno_toggle"].setVisible(False)
+        anno_panel.setVisible(True)
         self._reposition_overlay(pane)
 
-        return {
-            "viewer": viewer,
-            "cap": edit_cap,
-            "caption_container": caption_container,
-            "year": combo_year,
-            "month": combo_month,
-            "trading_info": trading_info_widget,
-            "chart_type": combo_chart_type,
-            "trading_amount": edit_trading_amount,
-            "trading_status": lbl_status,
-            "holdings_info": holdings_info_widget,
-            "circulation_stock": edit_circulation,
-            "circulation_ratio": lbl_circulation_ratio_value,
-            "institution_holdings": holdings_rows[0]["edit"],
-            "foreign_holdings": holdings_rows[1]["edit"],
-            "individual_holdings": holdings_rows[2]["edit"],
-            "holdings_toggle": btn_holdings_toggle,
-            "anno_toggle": btn_anno_toggle,
-            # desc_toggle 제거됨 - splitter 핸들 버튼 사용
-            "panel": anno_panel,
-            "draw": btn_draw_mode,
-        }
+    def _close_anno_panel(self, pane: str, reposition: bool = True) -> None:
+        ui = self._pane_ui.get(pane, {})
+        if not ui:
+            return
+        btn_draw_mode = ui.get("draw")
+        if btn_draw_mode is not None and btn_draw_mode.isChecked():
+            btn_draw_mode.setChecked(False)
+            ui["viewer"].set_mode_pan()
+        anno_panel = ui.get("panel")
+        if anno_panel is not None:
+            anno_panel.setVisible(False)
+        ui["anno_toggle"].setVisible(True)
+        if reposition:
+            self._reposition_overlay(pane)
 
     def _update_trading_status_for_pane(self, pane: str) -> None:
         """특정 pane의 거래대금 상태 업데이트"""
@@ -4225,10 +5009,25 @@ class MainWindow(QMainWindow):
     def _set_active_pane(self, pane: str) -> None:
         pane = "A" if pane not in ("A", "B") else pane
         self._active_pane = pane
-        if self.viewer_a is not None:
-            self.viewer_a.setStyleSheet("border: 2px solid #5A8DFF;" if pane == "A" else "border: 1px solid #D0D0D0;")
-        if self.viewer_b is not None:
-            self.viewer_b.setStyleSheet("border: 2px solid #5A8DFF;" if pane == "B" else "border: 1px solid #D0D0D0;")
+        # 같은 스타일시트를 다시 설정하면 CSS 재파싱 + polish가 일어나므로 바뀔 때만 설정
+        for viewer, name in ((self.viewer_a, "A"), (self.viewer_b, "B")):
+            if viewer is None:
+                continue
+            style = self.PANE_STYLE_ACTIVE if pane == name else self.PANE_STYLE_INACTIVE
+            if viewer.styleSheet() != style:
+                viewer.setStyleSheet(style)
+
+    def _schedule_reposition_overlay(self, pane: str, *_) -> None:
+        """연속된 변환/확장 변경을 다음 이벤트 루프에서 한 번의 재배치로 합침"""
+        timer = self._overlay_reposition_timers.get(pane)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(0)
+            timer.timeout.connect(partial(self._reposition_overlay, pane))
+            self._overlay_reposition_timers[pane] = timer
+        if not timer.isActive():
+            timer.start()
 
     def _reposition_overlay(self, pane: str) -> None:
         ui = self._pane_ui.get(pane, {})
@@ -4246,7 +5045,7 @@ class MainWindow(QMainWindow):
         holdings_info: QWidget = ui.get("holdings_info")
         btn_holdings_toggle: QToolButton = ui.get("holdings_toggle")
         btn_anno_toggle: QToolButton = ui["anno_toggle"]
-        anno_panel: QFrame = ui["panel"]
+        anno_panel: Optional[QFrame] = ui.get("panel")
 
         w = vp.width()
         margin = 10
@@ -4256,7 +5055,7 @@ class MainWindow(QMainWindow):
         button_gap = 4
         button_y = margin
         
-        if anno_panel.isVisible():
+        if anno_panel is not None and anno_panel.isVisible():
             panel_x = max(margin, w - anno_panel.width() - margin)
             anno_panel.move(panel_x, margin)
             btn_anno_x = max(margin, panel_x - margin - btn_anno_toggle.width())
@@ -4321,173 +5120,141 @@ class MainWindow(QMainWindow):
             expanded_set = set()
         
         self.nav_tree.blockSignals(True)
-        self.nav_tree.clear()
-        
-        # 표준 아이콘 준비
-        file_icon = self.style().standardIcon(QStyle.SP_FileIcon)
-        # 링크 아이콘 생성 (🔗 기호 사용)
-        link_pixmap = QPixmap(16, 16)
-        link_pixmap.fill(Qt.transparent)
-        link_painter = QPainter(link_pixmap)
-        link_painter.setRenderHint(QPainter.Antialiasing)
-        link_painter.setPen(QPen(QColor("#666666"), 2))
-        link_painter.setFont(QFont("Arial", 12))
-        link_painter.drawText(0, 0, 16, 16, Qt.AlignCenter, "🔗")
-        link_painter.end()
-        link_icon = QIcon(link_pixmap)
-
-        item_to_qitem: Dict[str, QTreeWidgetItem] = {}
-        cat_to_qitem: Dict[str, QTreeWidgetItem] = {}
-
-        def add_cat(cid: str, parent_q: Optional[QTreeWidgetItem]) -> Optional[QTreeWidgetItem]:
-            c = self.db.get_category(cid)
-            if not c:
-                return None
-            
-            # 자식이 있으면 사각형 + 아이콘 사용
-            has_children = bool(c.child_ids or c.item_ids)
+        # 재구성 중 페인트/정렬 억제
+        self.nav_tree.setUpdatesEnabled(False)
+        prev_sorting = self.nav_tree.isSortingEnabled()
+        self.nav_tree.setSortingEnabled(False)
+        try:
+            self.nav_tree.clear()
+        
+            # 표준 아이콘 준비 (링크 아이콘은 최초 1회만 그림)
+            file_icon = self.style().standardIcon(QStyle.SP_FileIcon)
+            link_icon = self._nav_link_icon()
+            # 행마다 새로 만들지 않고 공유 (QTreeWidgetItem이 값으로 복사해 둠)
+            cat_font = QFont()
+            cat_font.setBold(True)
+            url_color = QColor("#0066CC")
+            linked_color = QColor("#666666")
+
+            item_to_qitem: Dict[str, QTreeWidgetItem] = {}
+            cat_to_qitem: Dict[str, QTreeWidgetItem] = {}
+            # 트리 밖에서 전부 구성한 뒤 마지막에 한 번에 추가 (삽입마다 모델/레이아웃 갱신 방지)
+            top_items: List[QTreeWidgetItem] = []
+
+            def add_cat(cid: str) -> Optional[QTreeWidgetItem]:
+                c = self.db.get_category(cid)
+                if not c:
+                    return None
             
-            # 폴더 이름 표시: 조회 횟수와 URL 링크 표시
-            display_name = c.name
-            # 조회 횟수가 0보다 크면 표시
-            if c.view_count > 0:
-                display_name = f"{c.name} ({c.view_count})"
-            # URL이 있으면 링크 표시 추가
-            if c.url and c.url.strip():
-                if c.view_count > 0:
-                    display_name = f"{c.name} ({c.view_count}) 🔗"
-                else:
-                    display_name = f"{c.name} 🔗"
+                # 자식이 있으면 사각형 + 아이콘 사용
+                has_children = bool(c.child_ids or c.item_ids)
             
-            q = QTreeWidgetItem([display_name])
-            q.setData(0, self.NODE_TYPE_ROLE, "category")
-            q.setData(0, self.CATEGORY_ID_ROLE, c.id)
-            q.setFlags(q.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled)
+                q = QTreeWidgetItem([self._nav_category_display_name(c)])
+                q.setData(0, self.NODE_TYPE_ROLE, "category")
+                q.setData(0, self.CATEGORY_ID_ROLE, c.id)
+                q.setFlags(q.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled)
             
-            # 자식이 있으면 사각형 + 아이콘 설정
-            if has_children:
-                q.setIcon(0, _make_expand_icon(16, expanded=False))
+                # 자식이 있으면 사각형 + 아이콘 설정
+                if has_children:
+                    q.setIcon(0, _make_expand_icon(16, expanded=False))
             
-            # ✅ Category(폴더)만 Bold
-            f = q.font(0)
-            f.setBold(True)
-            q.setFont(0, f)
+                # ✅ Category(폴더)만 Bold
+                q.setFont(0, cat_font)
             
-            # URL이 있으면 툴팁에 표시 및 색상 변경
-            if c.url and c.url.strip():
-                q.setToolTip(0, f"URL: {c.url}\n우클릭하여 열기")
-                # URL이 있는 폴더는 파란색으로 표시
-                q.setForeground(0, QColor("#0066CC"))
+                # URL이 있으면 툴팁에 표시 및 색상 변경
+                if c.url and c.url.strip():
+                    q.setToolTip(0, f"URL: {c.url}\n우클릭하여 열기")
+                    # URL이 있는 폴더는 파란색으로 표시
+                    q.setForeground(0, url_color)
             
-            if parent_q is None:
-                self.nav_tree.addTopLevelItem(q)
-            else:
-                parent_q.addChild(q)
-            cat_to_qitem[cid] = q
+                cat_to_qitem[cid] = q
 
-            for iid in c.item_ids:
-                it = self.db.get_item(iid)
-                if not it:
-                    continue
-                # 링크된 Item이면 표시 이름에 링크 표시 추가
-                display_name = it.name
-                if it.linked_item_id:
-                    original = self.db.get_item(it.linked_item_id)
-                    if original:
-                        display_name = f"{it.name} → {original.name}"
-                    else:
-                        display_name = f"{it.name} → (삭제됨)"
-                
-                qi = QTreeWidgetItem([display_name])
-                qi.setData(0, self.NODE_TYPE_ROLE, "item")
-                qi.setData(0, self.ITEM_ID_ROLE, it.id)
-                qi.setFlags(qi.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-                
-                # ✅ Item(File) icon
-                if it.linked_item_id:
-                    qi.setIcon(0, link_icon)  # 링크 아이콘
-                else:
-                    qi.setIcon(0, file_icon)  # 일반 파일 아이콘
-                
-                # 툴팁 생성
-                tooltip_parts = []
-                
-                # 링크된 Item 정보
-                if it.linked_item_id:
-                    tooltip_parts.append(f"링크된 Item (원본: {original.name if original else '삭제됨'})")
-                
-                # 주력 제품/서비스 설명 및 유통 비율
-                business_info_parts = []
-                if it.business_description and it.business_description.strip():
-                    business_info_parts.append(it.business_description.strip())
-                if it.distribution_ratio > 0:
-                    business_info_parts.append(f"[{it.distribution_ratio}%]")
+                item_children: List[QTreeWidgetItem] = []
+                for iid in c.item_ids:
+                    it = self.db.get_item(iid)
+                    if not it:
+                        continue
+                    original = self.db.get_item(it.linked_item_id) if it.linked_item_id else None
+                    qi = QTreeWidgetItem([self._nav_item_display_name(it)])
+                    qi.setData(0, self.NODE_TYPE_ROLE, "item")
+                    qi.setData(0, self.ITEM_ID_ROLE, it.id)
+                    qi.setFlags(qi.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled)
                 
-                if business_info_parts:
-                    tooltip_parts.append(" ".join(business_info_parts))
+                    # ✅ Item(File) icon
+                    if it.linked_item_id:
+                        qi.setIcon(0, link_icon)  # 링크 아이콘
+                    else:
+                        qi.setIcon(0, file_icon)  # 일반 파일 아이콘
                 
-                # 툴팁 설정
-                if tooltip_parts:
-                    qi.setToolTip(0, "\n".join(tooltip_parts))
+                    # 툴팁 설정
+                    tooltip = self._nav_item_tooltip(it, original)
+                    if tooltip:
+                        qi.setToolTip(0, tooltip)
                 
-                # 링크된 Item은 다른 색상으로 표시
-                if it.linked_item_id:
-                    qi.setForeground(0, QColor("#666666"))
+                    # 링크된 Item은 다른 색상으로 표시
+                    if it.linked_item_id:
+                        qi.setForeground(0, linked_color)
                 
-                q.addChild(qi)
-                item_to_qitem[it.id] = qi
-
-            for ch in c.child_ids:
-                add_cat(ch, q)
-            return q
-
-        self.trace(f"트리 구성 시작 - root_category_ids 개수: {len(self.db.root_category_ids)}", "DEBUG")
-        # ROOT 폴더를 항상 첫 번째로 표시
-        if ROOT_CATEGORY_ID in self.db.root_category_ids:
-            self.trace(f"  ROOT 카테고리 추가: {ROOT_CATEGORY_ID}", "DEBUG")
-            add_cat(ROOT_CATEGORY_ID, None)
-        # 나머지 root 폴더들 추가
-        for rid in self.db.root_category_ids:
-            if rid != ROOT_CATEGORY_ID:
-                self.trace(f"  root 카테고리 추가: {rid}", "DEBUG")
-                add_cat(rid, None)
-        self.trace(f"트리 구성 완료 - topLevelItemCount: {self.nav_tree.topLevelItemCount()}", "DEBUG")
-
-        # 모든 카테고리의 아이콘 초기화 (모두 축소 상태로)
-        for cid, qitem in cat_to_qitem.items():
-            if qitem.childCount() > 0:
-                qitem.setIcon(0, _make_expand_icon(16, expanded=False))
-        
-        # blockSignals 해제
-        self.nav_tree.blockSignals(False)
-        
-        # 저장된 확장 상태 복원 (트리 구성 완료 후 즉시 복원)
-        self.trace(f"트리 확장 상태 복원 시작 - 저장된 확장 카테고리: {expanded_set}, 리스트: {expanded_categories}", "DEBUG")
-        self.trace(f"cat_to_qitem 키: {list(cat_to_qitem.keys())}", "DEBUG")
-        
-        if expanded_set:
-            # 저장된 확장 상태 복원 - cat_to_qitem 맵을 직접 사용
-            self.trace(f"저장된 확장 상태 복원 시작 - 확장할 카테고리: {expanded_set}", "DEBUG")
-            # 저장된 순서대로 부모부터 확장 (부모가 확장되어야 자식이 보임)
-            for cid in expanded_categories:
-                cid_str = str(cid)
-                if cid_str in expanded_set and cid_str in cat_to_qitem:
-                    qitem = cat_to_qitem[cid_str]
-                    if qitem.childCount() > 0:
-                        qitem.setExpanded(True)
-                        qitem.setIcon(0, _make_expand_icon(16, expanded=True))
-                        self.trace(f"카테고리 확장 성공: {cid_str}", "DEBUG")
-                    else:
-                        self.trace(f"카테고리 확장 실패 (자식 없음): {cid_str}", "DEBUG")
-                elif cid_str in expanded_set:
-                    self.trace(f"카테고리 확장 실패 (cat_to_qitem에 없음): {cid_str}", "DEBUG")
-            
-            # 모든 카테고리의 아이콘 최종 업데이트
-            for cid, qitem in cat_to_qitem.items():
-                if qitem.childCount() > 0:
-                    qitem.setIcon(0, _make_expand_icon(16, expanded=qitem.isExpanded()))
-        else:
-            self.trace("저장된 확장 상태 없음 - 모두 축소 상태 유지", "DEBUG")
+                    item_children.append(qi)
+                    item_to_qitem[it.id] = qi
+                if item_children:
+                    q.addChildren(item_children)
+
+                # 하위 폴더도 모아서 한 번에 붙임 (아이템 → 폴더 순서 유지)
+                cat_children = [cq for cq in (add_cat(ch) for ch in c.child_ids) if cq is not None]
+                if cat_children:
+                    q.addChildren(cat_children)
+                return q
+
+            self.trace(f"트리 구성 시작 - root_category_ids 개수: {len(self.db.root_category_ids)}", "DEBUG")
+            # ROOT 폴더를 항상 첫 번째로 표시
+            if ROOT_CATEGORY_ID in self.db.root_category_ids:
+                self.trace(f"  ROOT 카테고리 추가: {ROOT_CATEGORY_ID}", "DEBUG")
+                q_root = add_cat(ROOT_CATEGORY_ID)
+                if q_root is not None:
+                    top_items.append(q_root)
+            # 나머지 root 폴더들 추가
+            for rid in self.db.root_category_ids:
+                if rid != ROOT_CATEGORY_ID:
+                    self.trace(f"  root 카테고리 추가: {rid}", "DEBUG")
+                    q_top = add_cat(rid)
+                    if q_top is not None:
+                        top_items.append(q_top)
+            self.nav_tree.addTopLevelItems(top_items)
+            self.trace(f"트리 구성 완료 - topLevelItemCount: {self.nav_tree.topLevelItemCount()}", "DEBUG")
+
+            # 저장된 확장 상태 복원 (시그널 차단 상태에서 복원 -> itemExpanded 핸들러/상태 저장 타이머가 돌지 않음)
+            # 축소 아이콘은 add_cat에서 이미 설정됨
+            self.trace(f"트리 확장 상태 복원 시작 - 저장된 확장 카테고리: {expanded_set}, 리스트: {expanded_categories}", "DEBUG")
+            self.trace(f"cat_to_qitem 키: {list(cat_to_qitem.keys())}", "DEBUG")
+        
+            if expanded_set:
+                # 저장된 확장 상태 복원 - cat_to_qitem 맵을 직접 사용
+                self.trace(f"저장된 확장 상태 복원 시작 - 확장할 카테고리: {expanded_set}", "DEBUG")
+                # 저장된 순서대로 부모부터 확장 (부모가 확장되어야 자식이 보임)
+                for cid in expanded_categories:
+                    cid_str = str(cid)
+                    if cid_str in expanded_set and cid_str in cat_to_qitem:
+                        qitem = cat_to_qitem[cid_str]
+                        if qitem.childCount() > 0:
+                            qitem.setExpanded(True)
+                            qitem.setIcon(0, _make_expand_icon(16, expanded=True))
+                            self.trace(f"카테고리 확장 성공: {cid_str}", "DEBUG")
+                        else:
+                            self.trace(f"카테고리 확장 실패 (자식 없음): {cid_str}", "DEBUG")
+                    elif cid_str in expanded_set:
+                        self.trace(f"카테고리 확장 실패 (cat_to_qitem에 없음): {cid_str}", "DEBUG")
+            else:
+                self.trace("저장된 확장 상태 없음 - 모두 축소 상태 유지", "DEBUG")
+        finally:
+            self.nav_tree.setSortingEnabled(prev_sorting)
+            self.nav_tree.setUpdatesEnabled(True)
+            # blockSignals 해제
+            self.nav_tree.blockSignals(False)
+
+        # 이름 변경/이동 시 트리 전체 재구성 없이 해당 행만 갱신하기 위한 맵
+        self._nav_item_qitems = item_to_qitem
+        self._nav_cat_qitems = cat_to_qitem
 
         if select_current:
             if self.current_item_id and self.current_item_id in item_to_qitem:
@@ -4497,6 +5264,170 @@ class MainWindow(QMainWindow):
 
         self._update_left_buttons_enabled()
 
+    def _nav_category_display_name(self, c: Category) -> str:
+        """폴더 이름 표시: 조회 횟수와 URL 링크 표시"""
+        display_name = c.name
+        # 조회 횟수가 0보다 크면 표시
+        if c.view_count > 0:
+            display_name = f"{c.name} ({c.view_count})"
+        # URL이 있으면 링크 표시 추가
+        if c.url and c.url.strip():
+            if c.view_count > 0:
+                display_name = f"{c.name} ({c.view_count}) 🔗"
+            else:
+                display_name = f"{c.name} 🔗"
+        return display_name
+
+    def _nav_item_display_name(self, it: Item) -> str:
+        """링크된 Item이면 표시 이름에 링크 표시 추가"""
+        if not it.linked_item_id:
+            return it.name
+        original = self.db.get_item(it.linked_item_id)
+        if original:
+            return f"{it.name} → {original.name}"
+        return f"{it.name} → (삭제됨)"
+
+    def _nav_item_tooltip(self, it: Item, original: Optional[Item]) -> str:
+        tooltip_parts = []
+        # 링크된 Item 정보
+        if it.linked_item_id:
+            tooltip_parts.append(f"링크된 Item (원본: {original.name if original else '삭제됨'})")
+        # 주력 제품/서비스 설명 및 유통 비율
+        business_info_parts = []
+        if it.business_description and it.business_description.strip():
+            business_info_parts.append(it.business_description.strip())
+        if it.distribution_ratio > 0:
+            business_info_parts.append(f"[{it.distribution_ratio}%]")
+        if business_info_parts:
+            tooltip_parts.append(" ".join(business_info_parts))
+        return "\n".join(tooltip_parts)
+
+    def _nav_update_item_tooltip(self, iid: str) -> bool:
+        """아이템 설명/유통비율 변경을 해당 행 툴팁에만 반영. 실패 시 False"""
+        qi = self._nav_item_qitems.get(iid)
+        it = self.db.get_item(iid)
+        if qi is None or it is None:
+            return False
+        original = self.db.get_item(it.linked_item_id) if it.linked_item_id else None
+        qi.setToolTip(0, self._nav_item_tooltip(it, original))
+        return True
+
+    def _nav_update_item_text(self, iid: str) -> bool:
+        """아이템 이름 변경을 트리에 반영 (해당 행 + 이 아이템을 가리키는 링크 행). 실패 시 False"""
+        qi = self._nav_item_qitems.get(iid)
+        it = self.db.get_item(iid)
+        if qi is None or it is None:
+            return False
+        qi.setText(0, self._nav_item_display_name(it))
+        for other in self.db.items.values():
+            if other.linked_item_id == iid:
+                q_link = self._nav_item_qitems.get(other.id)
+                if q_link is not None:
+                    q_link.setText(0, self._nav_item_display_name(other))
+        return True
+
+    def _nav_update_category_text(self, cid: str) -> bool:
+        """폴더 이름/조회수/URL 변경을 해당 행에만 반영 (텍스트, URL 툴팁/색상). 실패 시 False"""
+        q = self._nav_cat_qitems.get(cid)
+        c = self.db.get_category(cid)
+        if q is None or c is None:
+            return False
+        q.setText(0, self._nav_category_display_name(c))
+        if c.url and c.url.strip():
+            q.setToolTip(0, f"URL: {c.url}\n우클릭하여 열기")
+            q.setForeground(0, QColor("#0066CC"))
+        else:
+            q.setToolTip(0, "")
+            q.setData(0, Qt.ForegroundRole, None)
+        return True
+
+    def _nav_move_category_row(self, cid: str) -> bool:
+        """폴더 형제 순서 변경을 트리에 반영 (해당 폴더 행만 떼었다가 새 위치에 끼움). 실패 시 False"""
+        q = self._nav_cat_qitems.get(cid)
+        c = self.db.get_category(cid)
+        if q is None or c is None:
+            return False
+        parent_q = q.parent()
+        if parent_q is None:
+            # 최상위: ROOT가 항상 먼저, 나머지는 root_category_ids 순서
+            order = [ROOT_CATEGORY_ID] + [x for x in self.db.root_category_ids if x != ROOT_CATEGORY_ID]
+            lead = 0
+        else:
+            parent = self.db.get_category(c.parent_id) if c.parent_id else None
+            if parent is None or self._nav_cat_qitems.get(parent.id) is not parent_q:
+                return False
+            # 폴더 안에서는 아이템 행들이 하위 폴더보다 앞
+            order = parent.child_ids
+            lead = sum(1 for x in parent.item_ids if x in self._nav_item_qitems)
+        if cid not in order:
+            return False
+        pos = order.index(cid)
+        index = lead + sum(1 for x in order[:pos] if x in self._nav_cat_qitems)
+        # 떼어낸 행은 뷰의 펼침 상태를 잃으므로 하위 포함 펼친 폴더를 기억했다가 복원
+        expanded: List[QTreeWidgetItem] = []
+        stack = [q]
+        while stack:
+            node = stack.pop()
+            if node.isExpanded():
+                expanded.append(node)
+            stack.extend(node.child(i) for i in range(node.childCount()))
+        self.nav_tree.blockSignals(True)
+        try:
+            if parent_q is None:
+                self.nav_tree.takeTopLevelItem(self.nav_tree.indexOfTopLevelItem(q))
+                self.nav_tree.insertTopLevelItem(index, q)
+            else:
+                parent_q.takeChild(parent_q.indexOfChild(q))
+                parent_q.insertChild(index, q)
+            for node in expanded:
+                node.setExpanded(True)
+        finally:
+            self.nav_tree.blockSignals(False)
+        self.nav_tree.setCurrentItem(q)
+        return True
+
+    def _nav_move_item_row(self, iid: str, target_cid: str) -> bool:
+        """아이템 행을 새 폴더 행 아래로 옮김 (폴더 안에서 아이템은 하위 폴더보다 앞, item_ids 순서). 실패 시 False"""
+        qi = self._nav_item_qitems.get(iid)
+        new_parent = self._nav_cat_qitems.get(target_cid)
+        c = self.db.get_category(target_cid)
+        if qi is None or new_parent is None or c is None or iid not in c.item_ids:
+            return False
+        old_parent = qi.parent()
+        if old_parent is None:
+            return False
+        pos = c.item_ids.index(iid)
+        index = sum(1 for x in c.item_ids[:pos] if x in self._nav_item_qitems)
+        self.nav_tree.blockSignals(True)
+        try:
+            old_parent.takeChild(old_parent.indexOfChild(qi))
+            new_parent.insertChild(index, qi)
+            # 확장 아이콘은 자식 유무에 따라 갱신
+            if old_parent.childCount() == 0:
+                old_parent.setIcon(0, QIcon())
+            if new_parent.childCount() == 1:
+                new_parent.setIcon(0, _make_expand_icon(16, expanded=new_parent.isExpanded()))
+        finally:
+            self.nav_tree.blockSignals(False)
+        self.nav_tree.setCurrentItem(qi)
+        return True
+
+    def _nav_link_icon(self) -> QIcon:
+        icon = getattr(self, "_link_icon_cache", None)
+        if icon is None:
+            # 링크 아이콘 생성 (🔗 기호 사용)
+            link_pixmap = QPixmap(16, 16)
+            link_pixmap.fill(Qt.transparent)
+            link_painter = QPainter(link_pixmap)
+            link_painter.setRenderHint(QPainter.Antialiasing)
+            link_painter.setPen(QPen(QColor("#666666"), 2))
+            link_painter.setFont(QFont("Arial", 12))
+            link_painter.drawText(0, 0, 16, 16, Qt.AlignCenter, "🔗")
+            link_painter.end()
+            icon = QIcon(link_pixmap)
+            self._link_icon_cache = icon
+        return icon
+
     def _update_left_buttons_enabled(self) -> None:
         it = self.nav_tree.currentItem()
         node_type = it.data(0, self.NODE_TYPE_ROLE) if it else None
@@ -4665,11 +5596,14 @@ class MainWindow(QMainWindow):
             saved_url = str(self.db.ui_state.get("url_input_text", "") or "")
             self.url_input.setText(saved_url)
         
-        it = self.current_item()
-        if it and it.pages:
-            self.current_page_index = max(0, min(self.current_page_index, len(it.pages) - 1))
-        else:
-            self.current_page_index = 0
+        self.current_page_index = self._clamp_page_index(self.current_item(), self.current_page_index)
+
+    @staticmethod
+    def _clamp_page_index(it: Optional[Item], idx: Any) -> int:
+        """페이지 인덱스를 아이템의 페이지 범위로 보정 (아이템/페이지가 없으면 0)"""
+        if not it or not it.pages:
+            return 0
+        return max(0, min(int(idx), len(it.pages) - 1))
 
     def current_item(self) -> Optional[Item]:
         """현재 선택된 Item 반환 (링크된 Item이면 원본 Item 반환)"""
@@ -4711,21 +5645,22 @@ class MainWindow(QMainWindow):
         # 트리 확장 상태 저장
         self._save_tree_expanded_state()
     
+    def _commit_nav_state(self, *, save: bool = False) -> None:
+        """선택/페이지 위치만 ui_state에 반영 (스플리터·트리 확장 상태는 그대로), save=True면 debounce 저장 예약"""
+        ui = self.db.ui_state
+        ui["selected_category_id"] = self.current_category_id
+        ui["selected_item_id"] = self.current_item_id
+        ui["current_page_index"] = self.current_page_index
+        if save:
+            self._save_db_with_warning()
+
     def _save_tree_expanded_state(self) -> None:
         """현재 트리의 확장된 카테고리 ID 목록을 저장"""
-        expanded_ids = []
-        
-        def collect_expanded(item: QTreeWidgetItem):
-            node_type = item.data(0, self.NODE_TYPE_ROLE)
-            if node_type == "category" and item.isExpanded() and item.childCount() > 0:
-                cid = str(item.data(0, self.CATEGORY_ID_ROLE) or "")
-                if cid:
-                    expanded_ids.append(cid)
-            for i in range(item.childCount()):
-                collect_expanded(item.child(i))
-        
-        for i in range(self.nav_tree.topLevelItemCount()):
-            collect_expanded(self.nav_tree.topLevelItem(i))
+        # 폴더 행 맵은 트리 전위 순서(부모 → 자식)로 채워져 있으므로 아이템 행까지 순회할 필요 없음
+        expanded_ids = [
+            cid for cid, q in self._nav_cat_qitems.items()
+            if cid and q.isExpanded() and q.childCount() > 0
+        ]
         
         self.db.ui_state["tree_expanded_categories"] = expanded_ids
         print(f"[DEBUG] 트리 확장 상태 저장: {expanded_ids}")
@@ -4812,10 +5747,11 @@ class MainWindow(QMainWindow):
                 if not it.pages:
                     self.trace(f"경고: 아이템 '{it.name}'에 페이지가 없습니다. 기본 페이지를 생성합니다.", "WARN")
                     it.pages = [self.db.new_page()]
-                self.current_page_index = max(0, min(it.last_page_index, len(it.pages) - 1))
+                self.current_page_index = self._clamp_page_index(it, it.last_page_index)
                 
-                # 마지막 접근 시간 업데이트
+                # 마지막 접근 시간 업데이트 (이전 아이템 flush로 예약된 저장에 함께 기록)
                 it.last_accessed_at = _now_epoch()
+                self.db.mark_item_dirty(it.id)
                 self._update_recent_items_list()
                 
                 self._save_ui_state()
@@ -4895,14 +5831,69 @@ class MainWindow(QMainWindow):
             self.trace(traceback.format_exc(), "ERROR")
 
     # ---------------- Safe save wrapper ----------------
-    def _save_db_with_warning(self) -> bool:
-        self.trace("_save_db_with_warning() 호출됨", "DEBUG")
+    def _save_db_with_warning(self, immediate: bool = False, item_id: Optional[str] = None) -> bool:
+        """
+        DB 저장 요청. 기본은 700ms debounce 후 저장, 결과가 필요하면 immediate=True
+        item_id가 주어지면 해당 아이템만 바뀐 것으로 보고 journal 증분 저장 대상이 됨
+        """
+        if item_id:
+            self.db.mark_item_dirty(item_id)
+        else:
+            self.db.mark_full_save_needed()
+        if immediate:
+            return self._do_db_save()
+        self._db_save_timer.start(700)
+        return True
+
+    def _do_db_save(self) -> bool:
+        self._db_save_timer.stop()
+        self.trace("_do_db_save() 호출됨", "DEBUG")
+        # 진행 중인 백그라운드 쓰기와 같은 tmp 파일을 건드리지 않도록 먼저 대기
+        self._db_write_pool.waitForDone()
+        self._db_write_pending = False
         ok, error_msg = self.db.save()
         if ok:
             self.trace("저장 성공", "DEBUG")
             return True
         self.trace(f"저장 실패: {error_msg}", "DEBUG")
-        
+        self._warn_save_failed(error_msg)
+        return False
+
+    def _save_db_in_background(self) -> None:
+        """직렬화는 GUI 스레드에서, 파일 쓰기(백업/tmp/replace)는 워커 스레드에서 수행"""
+        if self._db_write_running:
+            self._db_write_pending = True
+            return
+        journal_payload = self.db.journal_snapshot()
+        if journal_payload is not None:
+            task = _DbWriteTask(self.db.journal_path, journal_payload, is_journal=True)
+        else:
+            payload, error_msg = self.db.snapshot_json()
+            if payload is None and not error_msg:
+                self.trace("변경 없음 - 저장 생략", "DEBUG")
+                return
+            if payload is None:
+                self.trace(f"저장 실패: {error_msg}", "DEBUG")
+                self._warn_save_failed(error_msg)
+                return
+            task = _DbWriteTask(self.db.db_path, payload, journal_path=self.db.journal_path)
+        task.signals.finished.connect(self._on_db_write_finished)
+        self._db_write_running = True
+        self._db_write_pool.start(task)
+
+    def _on_db_write_finished(self, ok: bool, error_msg: str) -> None:
+        self._db_write_running = False
+        if ok:
+            self.trace("저장 성공", "DEBUG")
+        else:
+            self.trace(f"저장 실패: {error_msg}", "DEBUG")
+            self.db.mark_save_failed()
+            self._warn_save_failed(error_msg)
+        if self._db_write_pending:
+            self._db_write_pending = False
+            self._save_db_in_background()
+
+    def _warn_save_failed(self, error_msg: Optional[str]) -> None:
         # 저장 실패 시 상세한 에러 로그 및 경고
         now = time.time()
         if (now - self._last_save_warn_ts) >= self._save_warn_cooldown_sec:
@@ -4925,12 +5916,14 @@ class MainWindow(QMainWindow):
             warning_msg += "- data 폴더에 notes_db.json.autosave.<timestamp>.json 파일이 생성되었을 수 있습니다"
             
             QMessageBox.warning(self, "Save warning", warning_msg)
-        return False
 
     # ---------------- Page load/save ----------------
     def _load_current_item_page_to_ui(self, clear_only: bool = False) -> None:
         it = self.current_item()
         pg = self.current_page()
+        # 뷰어를 모델 기준으로 다시 채우므로 저장 대기 중인 붙여넣기 표시는 더 이상 화면에 없음
+        for pane in list(self._clip_shown):
+            self._detach_clip_display(pane)
 
         if clear_only or (not it) or (not pg):
             self._loading_ui = True
@@ -4952,9 +5945,7 @@ class MainWindow(QMainWindow):
                             ui["year"].setCurrentIndex(0)  # "-" 선택
                         if "month" in ui:
                             ui["month"].setCurrentIndex(0)  # "-" 선택
-                        ui["draw"].setChecked(False)
-                        ui["panel"].setVisible(False)
-                        ui["anno_toggle"].setVisible(True)
+                        self._close_anno_panel(pane, reposition=False)
                     viewer = self.viewer_a if pane == "A" else self.viewer_b
                     if viewer is not None:
                         viewer.clear_image()
@@ -4962,7 +5953,9 @@ class MainWindow(QMainWindow):
                     cb.setChecked(False)
                 for note in self.chk_notes:
                     note.clear()
+                    note.document().setModified(False)
                 self.text_edit.clear()
+                self.text_edit.document().setModified(False)
                 self._clear_custom_checklist_ui()
                 self._update_nav()
                 self._set_active_rich_edit(self.text_edit)
@@ -4976,9 +5969,9 @@ class MainWindow(QMainWindow):
             self.edit_stock_name.setText(pg.stock_name or "")
             self.edit_ticker.setText(pg.ticker or "")
 
-            if self._pane_ui.get("A"):
-                self._pane_ui["A"]["cap"].setPlainText(pg.image_a_caption or "")
-                ui_a = self._pane_ui["A"]
+            ui_a = self._pane_ui.get("A")
+            if ui_a:
+                ui_a["cap"].setPlainText(pg.image_a_caption or "")
                 if "chart_type" in ui_a and "trading_amount" in ui_a and "trading_status" in ui_a:
                     chart_type_a = pg.chart_type_a if pg.chart_type_a in ["일봉", "분봉"] else "일봉"
                     ui_a["chart_type"].setCurrentText(chart_type_a)
@@ -5027,9 +6020,9 @@ class MainWindow(QMainWindow):
                             ui_a["individual_holdings"].setText("")
                     # 상태 수동 업데이트
                     QTimer.singleShot(0, lambda: self._update_trading_status_for_pane("A"))
-            if self._pane_ui.get("B"):
-                self._pane_ui["B"]["cap"].setPlainText(pg.image_b_caption or "")
-                ui_b = self._pane_ui["B"]
+            ui_b = self._pane_ui.get("B")
+            if ui_b:
+                ui_b["cap"].setPlainText(pg.image_b_caption or "")
                 if "chart_type" in ui_b and "trading_amount" in ui_b and "trading_status" in ui_b:
                     chart_type_b = pg.chart_type_b if pg.chart_type_b in ["일봉", "분봉"] else "일봉"
                     ui_b["chart_type"].setCurrentText(chart_type_b)
@@ -5080,7 +6073,8 @@ class MainWindow(QMainWindow):
                     QTimer.singleShot(0, lambda: self._update_trading_status_for_pane("B"))
 
             if self.viewer_a is not None:
-                if pg.image_a_path and os.path.exists(_abspath_from_rel(pg.image_a_path)):
+                # 파일이 없으면 QPixmap이 null → set_image_path가 clear_image 처리 (별도 stat 불필요)
+                if pg.image_a_path:
                     self.viewer_a.set_image_path(_abspath_from_rel(pg.image_a_path))
                 else:
                     self.viewer_a.clear_image()
@@ -5088,36 +6082,42 @@ class MainWindow(QMainWindow):
                 self.viewer_a.set_mode_pan()
 
             if self.viewer_b is not None:
-                if pg.image_b_path and os.path.exists(_abspath_from_rel(pg.image_b_path)):
+                if pg.image_b_path:
                     self.viewer_b.set_image_path(_abspath_from_rel(pg.image_b_path))
                 else:
                     self.viewer_b.clear_image()
                 self.viewer_b.set_strokes(pg.strokes_b or [])
                 self.viewer_b.set_mode_pan()
 
+            # 로드 중 값 설정은 시그널 자체를 막아 _on_page_field_changed 등 슬롯 호출을 생략
+            # (체크 색상/서식 버튼은 아래에서 직접 갱신)
             cl = _normalize_checklist(pg.checklist)
-            for i in range(len(DEFAULT_CHECK_QUESTIONS)):
-                checked = bool(cl[i].get("checked", False))
-                self.chk_boxes[i].setChecked(checked)
+            for cb, note_edit, entry in zip(self.chk_boxes, self.chk_notes, cl):
+                checked = bool(entry.get("checked", False))
+                with _signals_blocked(cb):
+                    cb.setChecked(checked)
                 # 체크 상태에 따라 색상 업데이트
-                self._update_checkbox_color(self.chk_boxes[i], Qt.Checked if checked else Qt.Unchecked)
-                val = _strip_highlight_html(str(cl[i].get("note", "") or ""))
-                self.chk_notes[i].setHtml(val) if _looks_like_html(val) else self.chk_notes[i].setPlainText(val)
+                self._update_checkbox_color(cb, Qt.Checked if checked else Qt.Unchecked)
+                val = _strip_highlight_html(str(entry.get("note", "") or ""))
+                with _signals_blocked(note_edit):
+                    note_edit.setHtml(val) if _looks_like_html(val) else note_edit.setPlainText(val)
+                # 로드 직후를 기준으로 수정 여부 판단 (flush 시 toHtml 생략용)
+                note_edit.document().setModified(False)
             
             # Custom Checklist 로드
             custom_cl = _normalize_custom_checklist(pg.custom_checklist)
             self._load_custom_checklist_to_ui(custom_cl)
 
             val_desc = _strip_highlight_html(pg.note_text or "")
-            self.text_edit.setHtml(val_desc) if _looks_like_html(val_desc) else self.text_edit.setPlainText(val_desc)
+            with _signals_blocked(self.text_edit):
+                self.text_edit.setHtml(val_desc) if _looks_like_html(val_desc) else self.text_edit.setPlainText(val_desc)
+            # 로드 직후 상태를 기준으로 변경 여부 판단 (flush 시 toHtml 생략용)
+            self.text_edit.document().setModified(False)
 
             for pane in ("A", "B"):
                 ui = self._pane_ui.get(pane, {})
                 if ui:
-                    ui["draw"].setChecked(False)
-                    ui["panel"].setVisible(False)
-                    ui["anno_toggle"].setVisible(True)
-                    self._reposition_overlay(pane)
+                    self._close_anno_panel(pane)
 
             self._update_nav()
             self._set_active_rich_edit(self.text_edit)
@@ -5128,14 +6128,31 @@ class MainWindow(QMainWindow):
     def _on_page_field_changed(self) -> None:
         if self._loading_ui:
             return
+        snd = self.sender()
+        key = snd.property(self.DIRTY_FIELD_PROP) if snd is not None else None
+        self._mark_field_dirty(str(key) if key else self.DIRTY_ALL)
+
+    def _mark_field_dirty(self, key: str) -> None:
+        """시그널 발신자 없이 바뀐 필드(탭 추가/삭제/이름 변경 등)를 dirty로 표시하고 저장 예약"""
+        if self._loading_ui:
+            return
+        self._dirty_fields.add(key)
         if not self.current_item_id:
             return
         self._save_timer.start(450)
 
-    def _collect_checklist_from_ui(self) -> Checklist:
+    def _collect_checklist_from_ui(self, prev: Optional[Checklist] = None) -> Checklist:
+        """prev가 주어지면 로드 이후 수정되지 않은 설명칸은 toHtml() 대신 prev의 값을 재사용"""
+        prev_cl = _normalize_checklist(prev) if prev is not None else None
         out: Checklist = []
-        for i, q in enumerate(DEFAULT_CHECK_QUESTIONS):
-            out.append({"q": q, "checked": bool(self.chk_boxes[i].isChecked()), "note": _strip_highlight_html(self.chk_notes[i].toHtml())})
+        for i, (q, cb, note_edit) in enumerate(zip(DEFAULT_CHECK_QUESTIONS, self.chk_boxes, self.chk_notes)):
+            doc = note_edit.document()
+            if prev_cl is not None and not doc.isModified():
+                note = _strip_highlight_html(str(prev_cl[i].get("note", "") or ""))
+            else:
+                note = _strip_highlight_html(note_edit.toHtml())
+                doc.setModified(False)
+            out.append({"q": q, "checked": bool(cb.isChecked()), "note": note})
         return out
     
     def _collect_custom_checklist_from_ui(self) -> CustomChecklist:
@@ -5170,6 +6187,7 @@ class MainWindow(QMainWindow):
         
         cb = QCheckBox()
         cb.setChecked(checked)
+        cb.setProperty(self.DIRTY_FIELD_PROP, "custom_checklist")
         cb.stateChanged.connect(self._on_page_field_changed)
         cb.stateChanged.connect(lambda state, checkbox=cb: self._update_checkbox_color(checkbox, state))
         cb.setStyleSheet("""
@@ -5183,6 +6201,7 @@ class MainWindow(QMainWindow):
         
         q_edit = QLineEdit(question)
         q_edit.setPlaceholderText("질문을 입력하세요...")
+        q_edit.setProperty(self.DIRTY_FIELD_PROP, "custom_checklist")
         q_edit.textChanged.connect(self._on_page_field_changed)
         
         del_btn = QPushButton("삭제")
@@ -5199,10 +6218,7 @@ class MainWindow(QMainWindow):
         note_edit.setFixedHeight(54)
         if note:
             note_edit.setHtml(note) if _looks_like_html(note) else note_edit.setPlainText(note)
-        note_edit.textChanged.connect(self._on_page_field_changed)
-        note_edit.installEventFilter(self)
-        note_edit.cursorPositionChanged.connect(self._on_any_rich_cursor_changed)
-        note_edit.setTabChangesFocus(False)
+        self._wire_rich_edit(note_edit, "custom_checklist")
         
         item_layout.addWidget(top_row)
         item_layout.addWidget(note_edit)
@@ -5252,6 +6268,15 @@ class MainWindow(QMainWindow):
                 self._add_custom_checklist_item_ui(q_text, checked, note)
 
     def _flush_page_fields_to_model_and_save(self) -> None:
+        """UI → 모델 반영 후 (debounce된) 저장 1회 예약"""
+        it = self.current_item()
+        has_page = bool(it and self.current_page() and not self._loading_ui)
+        self._flush_page_fields_to_model()
+        if has_page:
+            self._save_db_with_warning(item_id=it.id)
+
+    def _flush_page_fields_to_model(self) -> bool:
+        """UI 필드를 현재 페이지 모델에 반영만 함 (저장은 호출자가 한 번). Returns: 페이지 변경 여부"""
         it = self.current_item()
         pg = self.current_page()
         if not it or not pg or self._loading_ui:
@@ -5269,7 +6294,7 @@ class MainWindow(QMainWindow):
                 if self.db.global_ideas != new_global_ideas or self.db.global_interests != new_global_interests:
                     self._save_ui_state()
                     # 저장 실패 시 명시적으로 처리
-                    save_ok = self._save_db_with_warning()
+                    save_ok = self._save_db_with_warning(immediate=True)
                     if not save_ok:
                         self.trace("Global Ideas/Interests 저장 실패 - 백업은 생성되었지만 DB 저장에 실패했습니다", "ERROR")
             except Exception as e:
@@ -5286,34 +6311,51 @@ class MainWindow(QMainWindow):
                     f"백업 파일은 생성되었을 수 있습니다. "
                     f"앱을 재시작하면 이전 내용이 복구될 수 있습니다."
                 )
-            return
+            return False
 
         changed = False
+        # 변경 표시된 필드만 위젯에서 다시 읽음 (toHtml 등 직렬화 비용 회피)
+        dirty = self._dirty_fields
+        self._dirty_fields = set()
+        read_all = self.DIRTY_ALL in dirty
+
+        def is_dirty(key: str) -> bool:
+            return read_all or key in dirty
+
         # Ideas 탭들 수집
-        new_global_ideas = self._collect_ideas_tabs_from_ui()
-        if self.db.global_ideas != new_global_ideas:
-            # Global Ideas 변경 시 백업 생성
-            _backup_global_ideas(self.db.global_ideas)
-            self.db.global_ideas = new_global_ideas
-            changed = True
+        if is_dirty("ideas"):
+            new_global_ideas = self._collect_ideas_tabs_from_ui()
+            if self.db.global_ideas != new_global_ideas:
+                # Global Ideas 변경 시 백업 생성
+                _backup_global_ideas(self.db.global_ideas)
+                self.db.global_ideas = new_global_ideas
+                # journal에는 아이템/ui_state만 담기므로 전역 데이터 변경은 전체 저장으로
+                self.db.mark_full_save_needed()
+                changed = True
         
         # Interests 탭들 수집
-        new_global_interests = self._collect_interests_tabs_from_ui()
-        if self.db.global_interests != new_global_interests:
-            self.db.global_interests = new_global_interests
-            changed = True
-
-        capA = self._pane_ui.get("A", {}).get("cap")
-        capB = self._pane_ui.get("B", {}).get("cap")
-        new_cap_a = capA.toPlainText() if capA is not None else ""
-        new_cap_b = capB.toPlainText() if capB is not None else ""
-        if pg.image_a_caption != new_cap_a:
-            pg.image_a_caption = new_cap_a; changed = True
-        if pg.image_b_caption != new_cap_b:
-            pg.image_b_caption = new_cap_b; changed = True
+        if is_dirty("interests"):
+            new_global_interests = self._collect_interests_tabs_from_ui()
+            if self.db.global_interests != new_global_interests:
+                self.db.global_interests = new_global_interests
+                self.db.mark_full_save_needed()
+                changed = True
+
+        # 페인별 위젯 dict는 한 번만 조회해서 캡션/거래 정보 수집에 같이 사용
+        ui_a = self._pane_ui.get("A", {}) if is_dirty("pane_A") else {}
+        ui_b = self._pane_ui.get("B", {}) if is_dirty("pane_B") else {}
+        if is_dirty("pane_A"):
+            capA = ui_a.get("cap")
+            new_cap_a = capA.toPlainText() if capA is not None else ""
+            if pg.image_a_caption != new_cap_a:
+                pg.image_a_caption = new_cap_a; changed = True
+        if is_dirty("pane_B"):
+            capB = ui_b.get("cap")
+            new_cap_b = capB.toPlainText() if capB is not None else ""
+            if pg.image_b_caption != new_cap_b:
+                pg.image_b_caption = new_cap_b; changed = True
         
         # 거래대금 정보 및 년도/월 수집
-        ui_a = self._pane_ui.get("A", {})
         if ui_a:
             chart_type_a = ui_a.get("chart_type")
             trading_amount_a = ui_a.get("trading_amount")
@@ -5384,7 +6426,6 @@ class MainWindow(QMainWindow):
                 if pg.individual_holdings_a != new_individual_a:
                     pg.individual_holdings_a = new_individual_a; changed = True
         
-        ui_b = self._pane_ui.get("B", {})
         if ui_b:
             chart_type_b = ui_b.get("chart_type")
             trading_amount_b = ui_b.get("trading_amount")
@@ -5455,48 +6496,57 @@ class MainWindow(QMainWindow):
                 if pg.individual_holdings_b != new_individual_b:
                     pg.individual_holdings_b = new_individual_b; changed = True
 
-        new_text = _strip_highlight_html(self.text_edit.toHtml())
-        if pg.note_text != new_text:
-            pg.note_text = new_text; changed = True
-
-        new_name = self.edit_stock_name.text()
-        if pg.stock_name != new_name:
-            pg.stock_name = new_name; changed = True
-
-        new_ticker = self.edit_ticker.text()
-        if pg.ticker != new_ticker:
-            pg.ticker = new_ticker; changed = True
-
-        if self.viewer_a is not None:
-            new_strokes_a = self.viewer_a.get_strokes()
-            if pg.strokes_a != new_strokes_a:
-                pg.strokes_a = new_strokes_a; changed = True
-
-        if self.viewer_b is not None:
-            new_strokes_b = self.viewer_b.get_strokes()
-            if pg.strokes_b != new_strokes_b:
-                pg.strokes_b = new_strokes_b; changed = True
-
-        new_checklist = self._collect_checklist_from_ui()
-        if pg.checklist != new_checklist:
-            pg.checklist = new_checklist; changed = True
-        
-        new_custom_checklist = self._collect_custom_checklist_from_ui()
-        if pg.custom_checklist != new_custom_checklist:
-            pg.custom_checklist = new_custom_checklist; changed = True
+        # 문서가 마지막 flush 이후 수정된 경우에만 toHtml 직렬화
+        note_doc = self.text_edit.document()
+        if is_dirty("note_text") and note_doc.isModified():
+            new_text = _strip_highlight_html(self.text_edit.toHtml())
+            note_doc.setModified(False)
+            if pg.note_text != new_text:
+                pg.note_text = new_text; changed = True
+
+        if is_dirty("name"):
+            new_name = self.edit_stock_name.text()
+            if pg.stock_name != new_name:
+                pg.stock_name = new_name; changed = True
+
+        if is_dirty("ticker"):
+            new_ticker = self.edit_ticker.text()
+            if pg.ticker != new_ticker:
+                pg.ticker = new_ticker; changed = True
+
+        # 선 목록 전체 비교 대신 뷰어의 modified 플래그로 판단
+        # (붙여넣기 PNG 저장 대기 중인 페인의 선은 새 이미지 것이므로 _on_clip_image_saved에서 반영)
+        if self.viewer_a is not None and "A" not in self._clip_shown and self.viewer_a.is_strokes_modified():
+            pg.strokes_a = list(self.viewer_a.get_strokes()); changed = True
+            self.viewer_a.set_strokes_modified(False)
+
+        if self.viewer_b is not None and "B" not in self._clip_shown and self.viewer_b.is_strokes_modified():
+            pg.strokes_b = list(self.viewer_b.get_strokes()); changed = True
+            self.viewer_b.set_strokes_modified(False)
+
+        if is_dirty("checklist"):
+            new_checklist = self._collect_checklist_from_ui(pg.checklist)
+            if pg.checklist != new_checklist:
+                pg.checklist = new_checklist; changed = True
+        
+        if is_dirty("custom_checklist"):
+            new_custom_checklist = self._collect_custom_checklist_from_ui()
+            if pg.custom_checklist != new_custom_checklist:
+                pg.custom_checklist = new_custom_checklist; changed = True
 
         it.last_page_index = self.current_page_index
-        self._save_ui_state()
+        # 페이지 이동/자동 저장마다 호출되므로 선택/페이지 위치만 반영 (스플리터·트리 확장 상태는 종료/수동 저장 시)
+        self._commit_nav_state()
 
         if changed:
             pg.updated_at = _now_epoch()
-
-        self._save_db_with_warning()
+        return changed
 
     def force_save(self) -> None:
         self._flush_page_fields_to_model_and_save()
+        self._save_ui_state()
         # 저장 성공 여부 확인
-        save_ok = self._save_db_with_warning()
+        save_ok = self._save_db_with_warning(immediate=True)
         if save_ok:
             QMessageBox.information(self, "저장 완료", "데이터가 성공적으로 저장되었습니다.")
         # 저장 실패 시 _save_db_with_warning에서 이미 경고 메시지를 표시함
@@ -5505,14 +6555,33 @@ class MainWindow(QMainWindow):
         it = self.current_item()
         total = len(it.pages) if it else 0
         cur = (self.current_page_index + 1) if total > 0 else 0
+        # 페이지 번호/개수가 그대로면 라벨/버튼 갱신 생략 (버튼 상태는 (cur, total)로만 결정됨)
+        state = (cur, total)
+        if state == self._nav_prev_state:
+            return
+        self._nav_prev_state = state
         self.lbl_page.setText(f"{cur} / {total}")
-        self.btn_prev.setEnabled(total > 0 and self.current_page_index > 0)
-        self.btn_next.setEnabled(total > 0 and self.current_page_index < total - 1)
+        self.btn_prev.setEnabled(cur > 1)
+        self.btn_next.setEnabled(cur < total)
         self.btn_del_page.setEnabled(total > 1)
 
+    def _ensure_global_ideas_loaded(self) -> None:
+        if not self._ideas_loaded:
+            self._load_global_ideas_to_ui()
+
+    def _reload_global_ideas_ui(self) -> None:
+        """DB의 Ideas가 바뀐 경우: 패널이 열려 있으면 다시 로드, 닫혀 있으면 다음에 열 때 로드"""
+        if self.ideas_panel.isVisible():
+            self._load_global_ideas_to_ui()
+        else:
+            self._clear_ideas_tabs()
+            self._ideas_loaded = False
+
     def _load_global_ideas_to_ui(self) -> None:
         """Ideas 탭들을 UI에 로드"""
+        prev_loading = self._loading_ui
         self._loading_ui = True
+        self._ideas_loaded = True
         try:
             # 기존 탭들 모두 제거
             self._clear_ideas_tabs()
@@ -5527,7 +6596,7 @@ class MainWindow(QMainWindow):
                     content = str(idea.get("content", "") or "")
                     self._add_ideas_tab_ui(name, content)
         finally:
-            self._loading_ui = False
+            self._loading_ui = prev_loading
     
     def _add_ideas_tab_ui(self, name: str, content: str) -> None:
         """Ideas 탭 UI 추가"""
@@ -5544,10 +6613,9 @@ class MainWindow(QMainWindow):
         editor.setPlaceholderText("전역적으로 적용할 아이디어를 여기에 작성하세요... (서식/색상 가능)")
         if content:
             editor.setHtml(content) if _looks_like_html(content) else editor.setPlainText(content)
-        editor.textChanged.connect(self._on_page_field_changed)
-        editor.installEventFilter(self)
-        editor.cursorPositionChanged.connect(self._on_any_rich_cursor_changed)
-        editor.setTabChangesFocus(False)
+        editor.setProperty(self.RICH_HTML_PROP, content or "")
+        editor.document().setModified(False)
+        self._wire_rich_edit(editor, "ideas")
         
         tab_layout.addWidget(editor)
         self.ideas_tab_editors.append(editor)
@@ -5564,6 +6632,8 @@ class MainWindow(QMainWindow):
         tab_num = len(self.ideas_tab_editors) + 1
         name = f"Ideas {tab_num}"
         self._add_ideas_tab_ui(name, "")
+        # 빈 탭은 편집기 시그널이 없으므로 직접 표시 (다른 필드 flush에서 수집되지 않아 재시작 시 사라짐)
+        self._mark_field_dirty("ideas")
     
     def _on_delete_current_ideas_tab(self) -> None:
         """현재 선택된 Ideas 탭 삭제"""
@@ -5597,7 +6667,7 @@ class MainWindow(QMainWindow):
                 if 0 <= new_index < len(self.ideas_tab_editors):
                     self._set_active_rich_edit(self.ideas_tab_editors[new_index])
                 
-                self._on_page_field_changed()
+                self._mark_field_dirty("ideas")
     
     def _on_ideas_tab_changed(self, index: int) -> None:
         """Ideas 탭 변경 시"""
@@ -5622,7 +6692,7 @@ class MainWindow(QMainWindow):
             # 탭 이름 업데이트
             self.ideas_tabs.setTabText(index, new_name)
             # 데이터 저장
-            self._on_page_field_changed()
+            self._mark_field_dirty("ideas")
     
     def _clear_ideas_tabs(self) -> None:
         """Ideas 탭들 모두 제거"""
@@ -5632,12 +6702,15 @@ class MainWindow(QMainWindow):
     
     def _collect_ideas_tabs_from_ui(self) -> List[Dict[str, str]]:
         """Ideas 탭들에서 데이터 수집"""
+        if not self._ideas_loaded:
+            # 패널을 아직 열지 않았으면 편집된 내용이 없으므로 DB 값 그대로
+            return list(self.db.global_ideas)
         out: List[Dict[str, str]] = []
         for i in range(self.ideas_tabs.count()):
             name = self.ideas_tabs.tabText(i)
             if i < len(self.ideas_tab_editors):
                 editor = self.ideas_tab_editors[i]
-                content = _strip_highlight_html(editor.toHtml())
+                content = self._rich_edit_html(editor)
                 out.append({"name": name, "content": content})
         return out
     
@@ -5675,10 +6748,9 @@ class MainWindow(QMainWindow):
         editor.setPlaceholderText("최근 관심 종목을 여기에 작성하세요... (서식/색상 가능)")
         if content:
             editor.setHtml(content) if _looks_like_html(content) else editor.setPlainText(content)
-        editor.textChanged.connect(self._on_page_field_changed)
-        editor.installEventFilter(self)
-        editor.cursorPositionChanged.connect(self._on_any_rich_cursor_changed)
-        editor.setTabChangesFocus(False)
+        editor.setProperty(self.RICH_HTML_PROP, content or "")
+        editor.document().setModified(False)
+        self._wire_rich_edit(editor, "interests")
         
         tab_layout.addWidget(editor)
         self.interests_tab_editors.append(editor)
@@ -5695,6 +6767,7 @@ class MainWindow(QMainWindow):
         tab_num = len(self.interests_tab_editors) + 1
         name = f"Interest {tab_num}"
         self._add_interests_tab_ui(name, "")
+        self._mark_field_dirty("interests")
     
     def _on_delete_current_interests_tab(self) -> None:
         """현재 선택된 Interests 탭 삭제"""
@@ -5728,7 +6801,7 @@ class MainWindow(QMainWindow):
                 if 0 <= new_index < len(self.interests_tab_editors):
                     self._set_active_rich_edit(self.interests_tab_editors[new_index])
                 
-                self._on_page_field_changed()
+                self._mark_field_dirty("interests")
     
     def _on_interests_tab_changed(self, index: int) -> None:
         """Interests 탭 변경 시"""
@@ -5753,7 +6826,7 @@ class MainWindow(QMainWindow):
             # 탭 이름 업데이트
             self.interests_tabs.setTabText(index, new_name)
             # 데이터 저장
-            self._on_page_field_changed()
+            self._mark_field_dirty("interests")
     
     def _clear_interests_tabs(self) -> None:
         """Interests 탭들 모두 제거"""
@@ -5768,7 +6841,7 @@ class MainWindow(QMainWindow):
             name = self.interests_tabs.tabText(i)
             if i < len(self.interests_tab_editors):
                 editor = self.interests_tab_editors[i]
-                content = _strip_highlight_html(editor.toHtml())
+                content = self._rich_edit_html(editor)
                 out.append({"name": name, "content": content})
         return out
     
@@ -5845,34 +6918,18 @@ class MainWindow(QMainWindow):
         
         it, cat = found
         
-        # 트리에서 해당 item 찾아서 선택
-        def find_item_in_tree(parent_item, target_id):
-            for i in range(parent_item.childCount()):
-                child = parent_item.child(i)
-                node_type = child.data(0, self.NODE_TYPE_ROLE)
-                if node_type == "item":
-                    if str(child.data(0, self.ITEM_ID_ROLE) or "") == target_id:
-                        return child
-                elif node_type == "category":
-                    result = find_item_in_tree(child, target_id)
-                    if result:
-                        return result
-            return None
-        
-        # 트리에서 item 찾기
-        for i in range(self.nav_tree.topLevelItemCount()):
-            top_item = self.nav_tree.topLevelItem(i)
-            found_item = find_item_in_tree(top_item, item_id)
-            if found_item:
-                # 부모 폴더들 확장
-                parent = found_item.parent()
-                while parent:
-                    parent.setExpanded(True)
-                    parent = parent.parent()
-                
-                # item 선택
-                self.nav_tree.setCurrentItem(found_item)
-                return
+        # 트리에서 해당 item 찾아서 선택 (_refresh_nav_tree가 만든 id → 행 맵 사용)
+        found_item = self._nav_item_qitems.get(item_id)
+        if found_item is None:
+            return
+        # 부모 폴더들 확장
+        parent = found_item.parent()
+        while parent:
+            parent.setExpanded(True)
+            parent = parent.parent()
+
+        # item 선택
+        self.nav_tree.setCurrentItem(found_item)
 
     # ---------------- Page navigation ----------------
     def go_prev_page(self) -> None:
@@ -5882,7 +6939,7 @@ class MainWindow(QMainWindow):
         self._flush_page_fields_to_model_and_save()
         self.current_page_index -= 1
         it.last_page_index = self.current_page_index
-        self._save_ui_state()
+        self._commit_nav_state()
         self._load_current_item_page_to_ui()
 
     def go_next_page(self) -> None:
@@ -5892,20 +6949,19 @@ class MainWindow(QMainWindow):
         self._flush_page_fields_to_model_and_save()
         self.current_page_index += 1
         it.last_page_index = self.current_page_index
-        self._save_ui_state()
+        self._commit_nav_state()
         self._load_current_item_page_to_ui()
 
     def add_page(self) -> None:
         it = self.current_item()
         if not it:
             return
-        self._flush_page_fields_to_model_and_save()
+        self._flush_page_fields_to_model()
         insert_at = self.current_page_index + 1
         it.pages.insert(insert_at, self.db.new_page())
         self.current_page_index = insert_at
         it.last_page_index = self.current_page_index
-        self._save_ui_state()
-        self._save_db_with_warning()
+        self._commit_nav_state(save=True)
         self._load_current_item_page_to_ui()
 
     def delete_page(self) -> None:
@@ -5916,12 +6972,11 @@ class MainWindow(QMainWindow):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply != QMessageBox.Yes:
             return
-        self._flush_page_fields_to_model_and_save()
+        self._flush_page_fields_to_model()
         del it.pages[self.current_page_index]
-        self.current_page_index = max(0, min(self.current_page_index, len(it.pages) - 1))
+        self.current_page_index = self._clamp_page_index(it, self.current_page_index)
         it.last_page_index = self.current_page_index
-        self._save_ui_state()
-        self._save_db_with_warning()
+        self._commit_nav_state(save=True)
         self._load_current_item_page_to_ui()
 
     # ---------------- Image handling ----------------
@@ -5987,20 +7042,73 @@ class MainWindow(QMainWindow):
         dst_name = f"{pg.id}_{pane.lower()}_clip_{_now_epoch()}.png"
         dst_rel = _relpath_norm(os.path.join(dst_dir, dst_name))
         dst_abs = _abspath_from_rel(dst_rel)
-        if not img.save(dst_abs, "PNG"):
+        # PNG 인코딩은 워커 스레드에서; 화면에는 바로 표시하고 모델 경로/선/저장은 쓰기 성공 후
+        # _on_clip_image_saved에서 반영 (DB가 아직 없는 파일을 가리키지 않도록)
+        self._detach_clip_display(pane)
+        self._pending_clip_saves[dst_rel] = (it.id, pg.id, pane, None)
+        self._clip_shown[pane] = dst_rel
+        task = _ImageSaveTask(img, dst_abs, dst_rel)
+        task.signals.finished.connect(self._on_clip_image_saved)
+        self._image_save_pool.start(task)
+        # 디코딩 없이 클립보드 이미지를 그대로 표시
+        viewer.set_image_qimage(img)
+        viewer.set_strokes([])
+        viewer.setFocus(Qt.MouseFocusReason)
+
+    def _detach_clip_display(self, pane: str) -> None:
+        """저장 대기 중인 붙여넣기가 화면에서 내려갈 때, 그 위에 그린 선을 대기 항목에 보관"""
+        dst_rel = self._clip_shown.pop(pane, None)
+        pending = self._pending_clip_saves.get(dst_rel) if dst_rel else None
+        viewer = self.viewer_a if pane == "A" else self.viewer_b
+        if pending is None or viewer is None:
+            return
+        self._pending_clip_saves[dst_rel] = pending[:3] + (list(viewer.get_strokes()),)
+        viewer.set_strokes_modified(False)
+
+    def _on_clip_image_saved(self, ok: bool, dst_rel: str) -> None:
+        pending = self._pending_clip_saves.pop(dst_rel, None)
+        if pending is None:
+            return
+        iid, page_id, pane, kept_strokes = pending
+        # 붙여넣은 이미지가 아직 화면에 그대로 있는지 (그 사이 페이지 이동/다른 붙여넣기가 없었는지)
+        shown = self._clip_shown.get(pane) == dst_rel
+        if shown:
+            del self._clip_shown[pane]
+        viewer = self.viewer_a if pane == "A" else self.viewer_b
+        it = self.db.get_item(iid)
+        pg = next((p for p in it.pages if p.id == page_id), None) if it else None
+        if not ok:
+            # 모델은 바뀌지 않았으므로 화면만 모델의 이미지/선으로 되돌림
+            if shown and viewer is not None and pg is not None:
+                old_path = pg.image_a_path if pane == "A" else pg.image_b_path
+                if old_path:
+                    viewer.set_image_path(_abspath_from_rel(old_path))
+                else:
+                    viewer.clear_image()
+                viewer.set_strokes((pg.strokes_a if pane == "A" else pg.strokes_b) or [])
             QMessageBox.warning(self, "Paste failed", "Clipboard image could not be saved as PNG.")
             return
+        if pg is None:
+            return
+        # 표시 중이던 붙여넣기 이미지 위에 그린 선은 새 이미지의 선으로 반영
+        if shown and viewer is not None:
+            strokes = list(viewer.get_strokes())
+        else:
+            strokes = list(kept_strokes or [])
         if pane == "A":
-            pg.image_a_path = dst_rel; pg.strokes_a = []
+            pg.image_a_path = dst_rel; pg.strokes_a = strokes
         else:
-            pg.image_b_path = dst_rel; pg.strokes_b = []
+            pg.image_b_path = dst_rel; pg.strokes_b = strokes
         pg.updated_at = _now_epoch()
-        it.last_page_index = self.current_page_index
-        self._save_ui_state()
-        self._save_db_with_warning()
-        viewer.set_image_path(dst_abs)
-        viewer.set_strokes([])
-        viewer.setFocus(Qt.MouseFocusReason)
+        self._save_db_with_warning(item_id=iid)
+        if viewer is None or pg is not self.current_page():
+            return
+        if shown:
+            viewer.set_strokes_modified(False)
+        elif pane not in self._clip_shown:
+            # 저장 중에 페이지를 떠났다 돌아온 경우: 이전 이미지가 표시되어 있으므로 새 이미지로 교체
+            viewer.set_image_path(_abspath_from_rel(dst_rel))
+            viewer.set_strokes(strokes)
 
     def _set_image_from_file(self, pane: str, src_path: str) -> None:
         it = self.current_item()
@@ -6024,9 +7132,32 @@ class MainWindow(QMainWindow):
         dst_name = f"{pg.id}_{pane.lower()}{ext}"
         dst_rel = _relpath_norm(os.path.join(dst_dir, dst_name))
         dst_abs = _abspath_from_rel(dst_rel)
+        # 같은 폴더의 임시 이름으로 링크/복사한 뒤 os.replace로 교체
+        # (실패해도 페이지가 가리키는 기존 파일은 그대로, 기존 파일이 하드링크여도 원본에 써 들어가지 않음)
+        tmp_abs = f"{dst_abs}.tmp"
         try:
-            shutil.copy2(src_path, dst_abs)
+            # 이미 저장된 그 파일(또는 그 하드링크)을 다시 고른 경우: 복사할 것 없음
+            if not (os.path.exists(dst_abs) and os.path.samefile(src_path, dst_abs)):
+                if os.path.lexists(tmp_abs):
+                    os.remove(tmp_abs)
+                linked = False
+                if HARDLINK_IMAGES:
+                    try:
+                        os.link(src_path, tmp_abs)
+                        linked = True
+                    except (OSError, NotImplementedError, AttributeError):
+                        # 다른 볼륨/FAT 등 하드링크 불가 → 복사
+                        pass
+                if not linked:
+                    # 내용만 복사 (메타데이터 복사 생략)
+                    shutil.copyfile(src_path, tmp_abs)
+                os.replace(tmp_abs, dst_abs)
         except Exception as e:
+            try:
+                if os.path.lexists(tmp_abs):
+                    os.remove(tmp_abs)
+            except Exception:
+                pass
             QMessageBox.critical(self, "Copy failed", f"Failed to copy image:\n{e}")
             return
         if pane == "A":
@@ -6035,8 +7166,7 @@ class MainWindow(QMainWindow):
             pg.image_b_path = dst_rel; pg.strokes_b = []
         pg.updated_at = _now_epoch()
         it.last_page_index = self.current_page_index
-        self._save_ui_state()
-        self._save_db_with_warning()
+        self._commit_nav_state(save=True)
         viewer.set_image_path(dst_abs)
         viewer.set_strokes([])
         viewer.setFocus(Qt.MouseFocusReason)
@@ -6123,7 +7253,7 @@ class MainWindow(QMainWindow):
             self._refresh_nav_tree(select_current=False)
             self._show_placeholder(True)
             self._load_current_item_page_to_ui(clear_only=True)
-            self._load_global_ideas_to_ui()
+            self._reload_global_ideas_ui()
             
             # 저장
             self._save_db_with_warning()
@@ -6171,10 +7301,10 @@ class MainWindow(QMainWindow):
         self.current_category_id = c.id
         self.current_item_id = ""
         self.current_page_index = 0
-        self._save_ui_state()
+        self._commit_nav_state()
         # 저장 성공 여부 확인
         self.trace("폴더 저장 시도...", "DEBUG")
-        save_ok = self._save_db_with_warning()
+        save_ok = self._save_db_with_warning(immediate=True)
         if not save_ok:
             # 저장 실패 시 폴더 롤백
             if c.id in self.db.categories:
@@ -6215,7 +7345,7 @@ class MainWindow(QMainWindow):
         if not ok or not (new_name or "").strip():
             return
         self.db.rename_category(cid, new_name.strip())
-        save_ok = self._save_db_with_warning()
+        save_ok = self._save_db_with_warning(immediate=True)
         if not save_ok:
             # 저장 실패 시 이름 롤백
             self.db.rename_category(cid, old_name)
@@ -6226,7 +7356,20 @@ class MainWindow(QMainWindow):
                 "변경사항이 저장되지 않았으므로 앱을 종료하면 원래 이름으로 돌아갑니다."
             )
             return
-        self._refresh_nav_tree(select_current=True)
+        if not self._nav_update_category_text(cid):
+            self._refresh_nav_tree(select_current=True)
+
+    def _delete_folder_msg_box(self) -> Tuple[QMessageBox, QPushButton, QPushButton, QPushButton]:
+        """폴더 삭제 확인창: 한 번만 만들고 재사용 (버튼/레이아웃 재구성 생략)"""
+        if self._delete_folder_msg is None:
+            msg = QMessageBox(self)
+            msg.setWindowTitle("Delete Folder")
+            btn_move = msg.addButton("Move contents to parent & delete folder", QMessageBox.ActionRole)
+            btn_delete = msg.addButton("Delete folder and ALL contents", QMessageBox.DestructiveRole)
+            btn_cancel = msg.addButton("Cancel", QMessageBox.RejectRole)
+            msg.setEscapeButton(btn_cancel)
+            self._delete_folder_msg = (msg, btn_move, btn_delete, btn_cancel)
+        return self._delete_folder_msg
 
     def delete_folder(self) -> None:
         it = self.nav_tree.currentItem()
@@ -6242,12 +7385,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Cannot Delete", "ROOT 폴더는 삭제할 수 없습니다.")
             return
 
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Delete Folder")
+        msg, btn_move, btn_delete, btn_cancel = self._delete_folder_msg_box()
         msg.setText(f"Folder '{c.name}' 처리 방식을 선택하세요.")
-        btn_move = msg.addButton("Move contents to parent & delete folder", QMessageBox.ActionRole)
-        btn_delete = msg.addButton("Delete folder and ALL contents", QMessageBox.DestructiveRole)
-        btn_cancel = msg.addButton("Cancel", QMessageBox.RejectRole)
         msg.setDefaultButton(btn_cancel)
         msg.exec_()
         clicked = msg.clickedButton()
@@ -6269,8 +7408,8 @@ class MainWindow(QMainWindow):
         self.current_item_id = ""
         self.current_category_id = self.db.root_category_ids[0] if self.db.root_category_ids else ""
         self.current_page_index = 0
-        self._save_ui_state()
-        save_ok = self._save_db_with_warning()
+        self._commit_nav_state()
+        save_ok = self._save_db_with_warning(immediate=True)
         if not save_ok:
             QMessageBox.critical(
                 self,
@@ -6292,7 +7431,8 @@ class MainWindow(QMainWindow):
             return
         self.db.move_category_sibling(cid, direction)
         self._save_db_with_warning()
-        self._refresh_nav_tree(select_current=True)
+        if not self._nav_move_category_row(cid):
+            self._refresh_nav_tree(select_current=True)
 
     def add_item(self) -> None:
         self._flush_page_fields_to_model_and_save()
@@ -6425,10 +7565,10 @@ class MainWindow(QMainWindow):
         self.current_category_id = cid
         self.current_item_id = it.id
         self.current_page_index = 0
-        self._save_ui_state()
+        self._commit_nav_state()
         # 저장 성공 여부 확인
         self.trace("아이템 저장 시도...", "DEBUG")
-        save_ok = self._save_db_with_warning()
+        save_ok = self._save_db_with_warning(immediate=True)
         if not save_ok:
             # 저장 실패 시 아이템 롤백
             if it.id in self.db.items:
@@ -6483,7 +7623,7 @@ class MainWindow(QMainWindow):
         self.trace(f"레퍼런스 아이템 생성 완료 - ID: {linked_item.id}, category_id: {linked_item.category_id}", "DEBUG")
         
         # 저장
-        save_ok = self._save_db_with_warning()
+        save_ok = self._save_db_with_warning(immediate=True)
         if not save_ok:
             # 저장 실패 시 롤백
             if linked_item.id in self.db.items:
@@ -6503,7 +7643,7 @@ class MainWindow(QMainWindow):
         self.current_category_id = category_id
         self.current_item_id = linked_item.id
         self.current_page_index = 0
-        self._save_ui_state()
+        self._commit_nav_state()
         self._refresh_nav_tree(select_current=True)
         self._show_placeholder(False)
         self._load_current_item_page_to_ui()
@@ -6580,7 +7720,8 @@ class MainWindow(QMainWindow):
         actual_item.distribution_ratio = distribution_ratio
         
         self._save_db_with_warning()
-        self._refresh_nav_tree(select_current=True)
+        if not self._nav_update_item_tooltip(actual_item.id):
+            self._refresh_nav_tree(select_current=True)
         
         # 유통비율 표시 업데이트 (현재 선택된 아이템이 변경된 아이템인 경우)
         if self.current_item_id == iid or (it.linked_item_id and self.current_item_id == it.linked_item_id):
@@ -6604,7 +7745,8 @@ class MainWindow(QMainWindow):
             return
         self.db.rename_item(iid, new_name.strip())
         self._save_db_with_warning()
-        self._refresh_nav_tree(select_current=True)
+        if not self._nav_update_item_text(iid):
+            self._refresh_nav_tree(select_current=True)
         self._update_recent_items_list()  # 최근 작업 리스트 업데이트
 
     def delete_item(self) -> None:
@@ -6645,7 +7787,7 @@ class MainWindow(QMainWindow):
             if found:
                 self.current_item_id = fallback_iid
                 self.current_category_id = found[1].id
-                self.current_page_index = max(0, min(found[0].last_page_index, len(found[0].pages) - 1))
+                self.current_page_index = self._clamp_page_index(found[0], found[0].last_page_index)
                 self._show_placeholder(False)
             else:
                 self.current_item_id = ""
@@ -6658,8 +7800,7 @@ class MainWindow(QMainWindow):
             self.current_page_index = 0
             self._show_placeholder(True)
         
-        self._save_ui_state()
-        self._save_db_with_warning()
+        self._commit_nav_state(save=True)
         self._refresh_nav_tree(select_current=True)
         self._update_recent_items_list()  # 최근 작업 리스트 업데이트
         self._load_current_item_page_to_ui(clear_only=(not self.current_item_id))
@@ -6685,7 +7826,8 @@ class MainWindow(QMainWindow):
             
             cat.url = url
             self._save_db_with_warning()
-            self._refresh_nav_tree(select_current=True)
+            if not self._nav_update_category_text(cid):
+                self._refresh_nav_tree(select_current=True)
     
     def _edit_folder_url(self, cid: str) -> None:
         """폴더 URL 편집"""
@@ -6708,7 +7850,8 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             cat.url = ""
             self._save_db_with_warning()
-            self._refresh_nav_tree(select_current=True)
+            if not self._nav_update_category_text(cid):
+                self._refresh_nav_tree(select_current=True)
     
     def _open_folder_url(self, cid: str) -> None:
         """폴더 URL을 브라우저로 열기"""
@@ -6754,7 +7897,8 @@ class MainWindow(QMainWindow):
                 
                 cat.view_count = new_count
                 self._save_db_with_warning()
-                self._refresh_nav_tree(select_current=True)
+                if not self._nav_update_category_text(cid):
+                    self._refresh_nav_tree(select_current=True)
             except ValueError:
                 QMessageBox.warning(self, "Invalid Input", "숫자를 입력해주세요.")
     
@@ -6767,7 +7911,10 @@ class MainWindow(QMainWindow):
             return
         self.db.move_item_sibling(iid, direction)
         self._save_db_with_warning()
-        self._refresh_nav_tree(select_current=True)
+        it = self.db.get_item(iid)
+        # 같은 폴더 안 순서 변경: 해당 행만 새 위치로 옮김
+        if not it or not self._nav_move_item_row(iid, it.category_id):
+            self._refresh_nav_tree(select_current=True)
 
     def move_item_to_folder(self) -> None:
         """아이템을 다른 폴더로 이동"""
@@ -6831,9 +7978,9 @@ class MainWindow(QMainWindow):
         self._flush_page_fields_to_model_and_save()
         if self.db.move_item_to_category(iid, target_cat_id):
             self.current_category_id = target_cat_id
-            self._save_ui_state()
-            self._save_db_with_warning()
-            self._refresh_nav_tree(select_current=True)
+            self._commit_nav_state(save=True)
+            if not self._nav_move_item_row(iid, target_cat_id):
+                self._refresh_nav_tree(select_current=True)
             self.trace(f"Moved item '{it.name}' to folder '{selected_folder}'", "INFO")
         else:
             QMessageBox.warning(self, "Failed", "아이템 이동에 실패했습니다.")
@@ -6845,26 +7992,16 @@ class MainWindow(QMainWindow):
 
     def _on_any_rich_cursor_changed(self) -> None:
         snd = self.sender()
-        if snd is not None and snd is self._active_rich_edit:
-            self._sync_format_buttons()
+        if snd is not None and snd is self._active_rich_edit and not self._format_sync_timer.isActive():
+            self._format_sync_timer.start()
 
     def _apply_format(self, bold: Optional[bool] = None, italic: Optional[bool] = None, underline: Optional[bool] = None) -> None:
         ed = self._active_rich_edit
         if ed is None:
             return
-        fmt = QTextCharFormat()
-        if bold is not None:
-            fmt.setFontWeight(QFont.Bold if bold else QFont.Normal)
-        if italic is not None:
-            fmt.setFontItalic(bool(italic))
-        if underline is not None:
-            fmt.setFontUnderline(bool(underline))
-        cur = ed.textCursor()
-        if cur.hasSelection():
-            cur.mergeCharFormat(fmt)
-            ed.mergeCurrentCharFormat(fmt)
-        else:
-            ed.mergeCurrentCharFormat(fmt)
+        fmt = _style_char_format(bold, italic, underline)
+        # 선택 영역이 있으면 그 영역에, 없으면 입력 서식에 적용 (cursor.mergeCharFormat과 중복 적용하지 않음)
+        ed.mergeCurrentCharFormat(fmt)
         ed.setFocus(Qt.MouseFocusReason)
         self._on_page_field_changed()
 
@@ -6872,17 +8009,9 @@ class MainWindow(QMainWindow):
         ed = self._active_rich_edit
         if ed is None:
             return
-        c = QColor(color_hex)
-        if not c.isValid():
-            c = QColor(COLOR_DEFAULT)
-        fmt = QTextCharFormat()
-        fmt.setForeground(QBrush(c))
-        cur = ed.textCursor()
-        if cur.hasSelection():
-            cur.mergeCharFormat(fmt)
-            ed.mergeCurrentCharFormat(fmt)
-        else:
-            ed.mergeCurrentCharFormat(fmt)
+        fmt = _color_char_format(color_hex)
+        # 선택 영역이 있으면 그 영역에, 없으면 입력 서식에 적용 (cursor.mergeCharFormat과 중복 적용하지 않음)
+        ed.mergeCurrentCharFormat(fmt)
         ed.setFocus(Qt.MouseFocusReason)
         self._on_page_field_changed()
 
@@ -6892,11 +8021,9 @@ class MainWindow(QMainWindow):
         if ed is None:
             return
         cur = ed.textCursor()
-        style = QTextListFormat.ListDisc if kind == "bullet" else QTextListFormat.ListDecimal
-        fmt = QTextListFormat(); fmt.setStyle(style)
         cur.beginEditBlock()
         try:
-            cur.createList(fmt)
+            cur.createList(_list_format(kind))
         except Exception:
             pass
         cur.endEditBlock()
@@ -6928,11 +8055,9 @@ class MainWindow(QMainWindow):
             cur.endEditBlock()
         else:
             # 리스트가 없으면 생성
-            style = QTextListFormat.ListDisc if kind == "bullet" else QTextListFormat.ListDecimal
-            fmt = QTextListFormat(); fmt.setStyle(style)
             cur.beginEditBlock()
             try:
-                cur.createList(fmt)
+                cur.createList(_list_format(kind))
             except Exception:
                 pass
             cur.endEditBlock()
@@ -7035,65 +8160,46 @@ class MainWindow(QMainWindow):
         is_bold = cf.fontWeight() >= QFont.Bold
         is_italic = bool(cf.fontItalic())
         is_under = bool(cf.fontUnderline())
-        self.btn_fmt_bold.blockSignals(True); self.btn_fmt_italic.blockSignals(True); self.btn_fmt_underline.blockSignals(True)
-        self.btn_fmt_bold.setChecked(is_bold); self.btn_fmt_italic.setChecked(is_italic); self.btn_fmt_underline.setChecked(is_under)
-        self.btn_fmt_bold.blockSignals(False); self.btn_fmt_italic.blockSignals(False); self.btn_fmt_underline.blockSignals(False)
-
-        col = cf.foreground().color() if cf.foreground().style() != Qt.NoBrush else QColor(COLOR_DEFAULT)
-        if not col.isValid():
-            col = QColor(COLOR_DEFAULT)
-        col_hex = col.name().upper()
-
-        def _set_checked(btn: QToolButton, on: bool) -> None:
-            btn.blockSignals(True); btn.setChecked(on); btn.blockSignals(False)
-
-        if col_hex == QColor(COLOR_RED).name().upper():
-            _set_checked(self.btn_col_red, True)
-        elif col_hex == QColor(COLOR_BLUE).name().upper():
-            _set_checked(self.btn_col_blue, True)
-        elif col_hex == QColor(COLOR_YELLOW).name().upper():
-            _set_checked(self.btn_col_yellow, True)
-        else:
-            _set_checked(self.btn_col_default, True)
+        with _signals_blocked(self.btn_fmt_bold, self.btn_fmt_italic, self.btn_fmt_underline):
+            self.btn_fmt_bold.setChecked(is_bold); self.btn_fmt_italic.setChecked(is_italic); self.btn_fmt_underline.setChecked(is_under)
+
+        fg = cf.foreground()
+        col = fg.color()
+        col_hex = col.name().upper() if fg.style() != Qt.NoBrush and col.isValid() else ""
+        col_btn = self._color_btn_by_hex.get(col_hex, self.btn_col_default)
+        with _signals_blocked(col_btn):
+            col_btn.setChecked(True)
         
         # 리스트 상태 동기화
         cur = ed.textCursor()
         current_list = cur.currentList()
+        bullets = numbered = False  # 리스트가 없으면 둘 다 비활성화
         if current_list:
-            fmt = current_list.format()
-            style = fmt.style()
+            style = current_list.format().style()
             # 리스트 스타일에 따라 버튼 활성화
-            self.btn_bullets.blockSignals(True)
-            self.btn_numbered.blockSignals(True)
             if style == QTextListFormat.ListDisc or style == QTextListFormat.ListCircle or style == QTextListFormat.ListSquare:
-                self.btn_bullets.setChecked(True)
-                self.btn_numbered.setChecked(False)
+                bullets = True
             elif style == QTextListFormat.ListDecimal or style == QTextListFormat.ListLowerAlpha or style == QTextListFormat.ListUpperAlpha:
-                self.btn_bullets.setChecked(False)
-                self.btn_numbered.setChecked(True)
-            else:
-                self.btn_bullets.setChecked(False)
-                self.btn_numbered.setChecked(False)
-            self.btn_bullets.blockSignals(False)
-            self.btn_numbered.blockSignals(False)
-        else:
-            # 리스트가 없으면 둘 다 비활성화
-            self.btn_bullets.blockSignals(True)
-            self.btn_numbered.blockSignals(True)
-            self.btn_bullets.setChecked(False)
-            self.btn_numbered.setChecked(False)
-            self.btn_bullets.blockSignals(False)
-            self.btn_numbered.blockSignals(False)
+                numbered = True
+        with _signals_blocked(self.btn_bullets, self.btn_numbered):
+            self.btn_bullets.setChecked(bullets)
+            self.btn_numbered.setChecked(numbered)
 
     # ---------------- Ideas panel toggle ----------------
     def _on_toggle_ideas(self, checked: bool) -> None:
         self._set_global_ideas_visible(checked, persist=True)
 
     def _set_global_ideas_visible(self, visible: bool, persist: bool = True) -> None:
+        # 사용자 토글인데 상태가 그대로면 크기 기억/레이아웃/저장 모두 생략 (초기 적용(persist=False)은 항상 수행)
+        if persist and bool(visible) == (not self.ideas_panel.isHidden()):
+            return
         if (not visible) and self.notes_left.isVisible() and self.ideas_panel.isVisible():
             self._remember_notes_splitter_sizes()
+        if visible:
+            self._ensure_global_ideas_loaded()
         self.ideas_panel.setVisible(bool(visible))
-        self.btn_ideas.blockSignals(True); self.btn_ideas.setChecked(bool(visible)); self.btn_ideas.blockSignals(False)
+        with _signals_blocked(self.btn_ideas):
+            self.btn_ideas.setChecked(bool(visible))
         self._update_text_area_layout()
         if persist:
             self.db.ui_state["global_ideas_visible"] = bool(visible)
@@ -7104,10 +8210,13 @@ class MainWindow(QMainWindow):
         self._set_global_interests_visible(checked, persist=True)
 
     def _set_global_interests_visible(self, visible: bool, persist: bool = True) -> None:
+        if persist and bool(visible) == (not self.interests_panel.isHidden()):
+            return
         if (not visible) and self.notes_left.isVisible() and self.interests_panel.isVisible():
             self._remember_notes_splitter_sizes()
         self.interests_panel.setVisible(bool(visible))
-        self.btn_interests.blockSignals(True); self.btn_interests.setChecked(bool(visible)); self.btn_interests.blockSignals(False)
+        with _signals_blocked(self.btn_interests):
+            self.btn_interests.setChecked(bool(visible))
         self._update_text_area_layout()
         if persist:
             self.db.ui_state["global_interests_visible"] = bool(visible)
@@ -7123,6 +8232,9 @@ class MainWindow(QMainWindow):
         self._set_desc_visible(bool(checked), persist=True)
 
     def _set_desc_visible(self, visible: bool, persist: bool = True) -> None:
+        # 초기화 시에는 _desc_visible이 이미 저장값이라 persist=False 호출은 항상 적용
+        if persist and bool(visible) == self._desc_visible:
+            return
         if (not visible) and (self.notes_left.isVisible() or self.ideas_panel.isVisible() or self.interests_panel.isVisible()):
             self._remember_notes_splitter_sizes()
         self._desc_visible = bool(visible)
@@ -7213,15 +8325,14 @@ class MainWindow(QMainWindow):
     def _update_desc_toggle_button_text(self) -> None:
         """상단 Description 토글 버튼 텍스트 및 아이콘 업데이트"""
         if hasattr(self, 'btn_toggle_desc'):
-            self.btn_toggle_desc.blockSignals(True)
-            self.btn_toggle_desc.setChecked(self._desc_visible)
-            if self._desc_visible:
-                # Description이 보일 때: 체크 표시
-                self.btn_toggle_desc.setText("Description ✓")
-            else:
-                # Description이 숨겨져 있을 때: 오른쪽 화살표
-                self.btn_toggle_desc.setText("Description ▶")
-            self.btn_toggle_desc.blockSignals(False)
+            with _signals_blocked(self.btn_toggle_desc):
+                self.btn_toggle_desc.setChecked(self._desc_visible)
+                if self._desc_visible:
+                    # Description이 보일 때: 체크 표시
+                    self.btn_toggle_desc.setText("Description ✓")
+                else:
+                    # Description이 숨겨져 있을 때: 오른쪽 화살표
+                    self.btn_toggle_desc.setText("Description ▶")
     
     def _update_checkbox_color(self, checkbox: QCheckBox, state: int) -> None:
         """체크박스 상태에 따라 질문 텍스트 색상 업데이트"""
@@ -7312,82 +8423,80 @@ class MainWindow(QMainWindow):
 
     # ---------------- Event filter (active pane + resize overlay) ---------------- 
     def eventFilter(self, obj, event) -> bool:
-        va = getattr(self, "viewer_a", None)
-        vb = getattr(self, "viewer_b", None)
-        
-        # 드래그 감지: viewport에서 마우스 이벤트 감지
-        if va is not None and obj is va.viewport():
-            if event.type() == QEvent.MouseButtonPress:
-                self._set_active_pane("A")
-                # ScrollHandDrag 모드이고 왼쪽 버튼이면 드래그 시작
-                if va.dragMode() == QGraphicsView.ScrollHandDrag and event.button() == Qt.LeftButton:
-                    va._is_dragging = True
-                return False
-            elif event.type() == QEvent.MouseButtonRelease:
-                # 드래그 종료
-                if hasattr(va, '_is_dragging') and va._is_dragging:
-                    was_dragging = va._is_dragging
-                    va._is_dragging = False
-                    if was_dragging:
-                        QTimer.singleShot(10, va.transformChanged.emit)
-                return False
-        
-        if vb is not None and obj is vb.viewport():
-            if event.type() == QEvent.MouseButtonPress:
-                self._set_active_pane("B")
+        t = event.type()
+        # 뷰포트에는 마우스 이동/페인트 등이 계속 들어오므로 처리하는 세 종류 외에는 바로 통과
+        if t != QEvent.MouseButtonPress and t != QEvent.MouseButtonRelease and t != QEvent.Resize:
+            return super().eventFilter(obj, event)
+        for vp, pane, viewer in self._viewport_panes:
+            if obj is not vp:
+                continue
+            if t == QEvent.MouseButtonPress:
+                self._set_active_pane(pane)
                 # ScrollHandDrag 모드이고 왼쪽 버튼이면 드래그 시작
-                if vb.dragMode() == QGraphicsView.ScrollHandDrag and event.button() == Qt.LeftButton:
-                    vb._is_dragging = True
+                if viewer.dragMode() == QGraphicsView.ScrollHandDrag and event.button() == Qt.LeftButton:
+                    viewer._is_dragging = True
                 return False
-            elif event.type() == QEvent.MouseButtonRelease:
+            if t == QEvent.MouseButtonRelease:
                 # 드래그 종료
-                if hasattr(vb, '_is_dragging') and vb._is_dragging:
-                    was_dragging = vb._is_dragging
-                    vb._is_dragging = False
-                    if was_dragging:
-                        QTimer.singleShot(10, vb.transformChanged.emit)
+                if getattr(viewer, "_is_dragging", False):
+                    viewer._is_dragging = False
+                    QTimer.singleShot(10, viewer.transformChanged.emit)
                 return False
-        if va is not None and obj is va.viewport() and event.type() == QEvent.Resize:
-            self._reposition_overlay("A")
-            return super().eventFilter(obj, event)
-        if vb is not None and obj is vb.viewport() and event.type() == QEvent.Resize:
-            self._reposition_overlay("B")
-            return super().eventFilter(obj, event)
-        if isinstance(obj, QTextEdit) and event.type() == QEvent.FocusIn:
-            self._set_active_rich_edit(obj)
-            return super().eventFilter(obj, event)
-        # Tab/Shift+Tab 키로 리스트 들여쓰기/내어쓰기 지원
-        if isinstance(obj, QTextEdit) and event.type() == QEvent.KeyPress:
-            ed = self._active_rich_edit
-            if ed is not None and obj is ed:
-                if event.key() == Qt.Key_Tab:
-                    cur = ed.textCursor()
-                    current_list = cur.currentList()
-                    block_fmt = cur.blockFormat()
-                    # 리스트가 있거나 들여쓰기가 있으면 리스트 들여쓰기/내어쓰기 처리
-                    if current_list or block_fmt.indent() > 0 or block_fmt.leftMargin() > 0:
-                        if event.modifiers() & Qt.ShiftModifier:
-                            # Shift+Tab: 내어쓰기
-                            self._outdent_list()
-                        else:
-                            # Tab: 들여쓰기
-                            self._indent_list()
-                        return True
-                elif event.key() == Qt.Key_Backtab:  # Shift+Tab은 Backtab으로도 감지됨
-                    cur = ed.textCursor()
-                    current_list = cur.currentList()
-                    block_fmt = cur.blockFormat()
-                    # 리스트가 있거나 들여쓰기가 있으면 내어쓰기
-                    if current_list or block_fmt.indent() > 0 or block_fmt.leftMargin() > 0:
-                        self._outdent_list()
-                        return True
+            self._reposition_overlay(pane)
+            break
         return super().eventFilter(obj, event)
 
+    def _rich_edit_html(self, editor: QTextEdit) -> str:
+        """수정되지 않은 편집기는 마지막으로 로드/수집한 HTML을 재사용 (toHtml 직렬화 생략)"""
+        doc = editor.document()
+        cached = editor.property(self.RICH_HTML_PROP)
+        if cached is not None and not doc.isModified():
+            return str(cached)
+        html = _strip_highlight_html(editor.toHtml())
+        editor.setProperty(self.RICH_HTML_PROP, html)
+        doc.setModified(False)
+        return html
+
+    def _wire_rich_edit(self, ed: QTextEdit, dirty_field: str) -> None:
+        """서식 편집기 공통 연결: dirty 필드, 변경/커서 시그널, 공유 이벤트 필터"""
+        ed.setProperty(self.DIRTY_FIELD_PROP, dirty_field)
+        ed.textChanged.connect(self._on_page_field_changed)
+        ed.installEventFilter(self._rich_edit_filter)
+        ed.cursorPositionChanged.connect(self._on_any_rich_cursor_changed)
+        ed.setTabChangesFocus(False)
+
+    def _handle_rich_edit_key(self, obj, event) -> bool:
+        # Tab/Shift+Tab 키로 리스트 들여쓰기/내어쓰기 지원
+        ed = self._active_rich_edit
+        if ed is None or obj is not ed:
+            return False
+        key = event.key()
+        if key != Qt.Key_Tab and key != Qt.Key_Backtab:  # Shift+Tab은 Backtab으로도 감지됨
+            return False
+        cur = ed.textCursor()
+        block_fmt = cur.blockFormat()
+        # 리스트가 있거나 들여쓰기가 있을 때만 들여쓰기/내어쓰기 처리
+        if not (cur.currentList() or block_fmt.indent() > 0 or block_fmt.leftMargin() > 0):
+            return False
+        if key == Qt.Key_Backtab or event.modifiers() & Qt.ShiftModifier:
+            self._outdent_list()
+        else:
+            self._indent_list()
+        return True
+
 
 def main() -> None:
+    # 위젯 갱신 시 불투명 형제 위젯 영역 계산 생략
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     _ensure_dir("data")
     _ensure_dir(ASSETS_DIR)
+    # 마우스/태블릿 이동 이벤트를 렌더 주기에 맞춰 합쳐서 전달 (선 그리기 시 이벤트 수 감소)
+    for attr_name in ("AA_CompressHighFrequencyEvents", "AA_CompressTabletEvents"):
+        attr = getattr(Qt, attr_name, None)
+        if attr is not None:
+            QApplication.setAttribute(attr, True)
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
     win = MainWindow()
     win.show()
     sys.exit(app.exec_())